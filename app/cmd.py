@@ -24,30 +24,43 @@ Usage:
 """
 
 import asyncio
+import atexit
+import functools
 import sys
 import os
+from collections import deque
+from types import SimpleNamespace
 from uuid import uuid4
 from typing import Optional
 
 import click
 
-# Add paths for imports
-sys.path.insert(0, '.')
-sys.path.insert(0, 'sdk/python/src')
-
-# Fix Windows console encoding
+# Fix Windows console encoding via a direct WinAPI call - shelling out to
+# `chcp` would fork a cmd.exe on every CLI invocation
 if sys.platform == 'win32':
-    os.system('chcp 65001 > nul 2>&1')
+    import ctypes
+    ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+    ctypes.windll.kernel32.SetConsoleCP(65001)
     if hasattr(sys.stdout, 'reconfigure'):
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+# Use uvloop for lower event-loop overhead (not available on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+@functools.lru_cache(maxsize=16)
+def _border(length: int) -> str:
+    return "=" * (length + 4)
+
 
 def print_header(title: str):
     """Print a header with borders."""
-    border = "=" * (len(title) + 4)
-    print(f"\n{border}")
-    print(f"| {title} |")
-    print(f"{border}\n")
+    border = _border(len(title))
+    sys.stdout.write(f"\n{border}\n| {title} |\n{border}\n\n")
 
 
 def print_success(msg: str):
@@ -62,36 +75,164 @@ def print_info(msg: str):
     print(f"[INFO] {msg}")
 
 
-async def run_agent_chat_with_executor(session_id: str):
-    """Run interactive chat using ADKAgentExecutor for proper UCP handling."""
-    from backend.host_agent.agent import build_agent
+# Read stdin in 4 KiB chunks instead of one line at a time, so a pasted
+# multi-line prompt arrives in a single read. Complete lines are queued and
+# handed out one per call.
+_STDIN_CHUNK_SIZE = 4096
+_stdin_lines: deque = deque()
+_stdin_remainder = ""
+
+
+def read_input_line(prompt: str = "You: ") -> str:
+    """Read one line from stdin, buffering pasted input in large chunks."""
+    global _stdin_remainder
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    while not _stdin_lines:
+        chunk = os.read(sys.stdin.fileno(), _STDIN_CHUNK_SIZE)
+        if not chunk:
+            raise EOFError
+        buffer = _stdin_remainder + chunk.decode("utf-8", errors="replace")
+        lines = buffer.split("\n")
+        _stdin_remainder = lines.pop()
+        _stdin_lines.extend(lines)
+
+    return _stdin_lines.popleft()
+
+
+@functools.lru_cache(maxsize=1)
+def _deps() -> SimpleNamespace:
+    """Import the heavy ADK/A2A stack once and share it across commands.
+
+    Keeping these out of module scope means `--help` and `server` never pay
+    the import cost, while `chat` and `test` share a single import pass.
+    """
     from backend.host_agent.agent_executor import ADKAgentExecutor
     from backend.extensions.ucp_extension import UcpExtension
     from a2a.types import AgentExtension
-    from a2a.server.events import EventQueue
-    from a2a.server.agent_execution import RequestContext
     from google.adk.runners import Runner
     from google.adk.sessions import InMemorySessionService
     from google.genai import types
-    
+
+    return SimpleNamespace(
+        ADKAgentExecutor=ADKAgentExecutor,
+        UcpExtension=UcpExtension,
+        AgentExtension=AgentExtension,
+        Runner=Runner,
+        InMemorySessionService=InMemorySessionService,
+        types=types,
+    )
+
+
+# Building the agent loads MCP tools over the network, so cache it per process
+# and let back-to-back commands reuse the already-loaded tool list.
+_AGENT_CACHE: dict = {}
+_agent_lock = asyncio.Lock()
+
+
+async def get_agent_cached():
+    """Build the agent once per process and reuse it across commands."""
+    from backend.host_agent.agent import build_agent
+
+    async with _agent_lock:
+        if "agent" not in _AGENT_CACHE:
+            _AGENT_CACHE["agent"] = await build_agent()
+    return _AGENT_CACHE["agent"]
+
+
+async def _chat_loop(runner, session_id: str, user_id: str = "cli_user"):
+    """Shared REPL body: read input, run the agent, stream the response."""
+    types = _deps().types
+
+    loop = asyncio.get_running_loop()
+
+    # Ctrl-C is not catchable here: with the stdin read awaited on an
+    # executor, the interrupt is raised in the event-loop machinery and
+    # escapes run_until_complete. _run_chat catches it there and resumes
+    # this coroutine, still suspended on the same executor future — so
+    # at most one stdin reader is ever in flight and no typed line is
+    # lost to an abandoned read.
+    while True:
+        # Read input on a worker thread so the event loop stays responsive
+        user_input = await loop.run_in_executor(None, read_input_line, "You: ")
+
+        if user_input.strip().lower() in ["quit", ":q", "exit"]:
+            print("Goodbye!")
+            break
+
+        if not user_input.strip():
+            continue
+
+        # Create user message
+        user_message = types.Content(
+            parts=[types.Part(text=user_input)],
+            role="user"
+        )
+
+        print_info("Thinking...")
+
+        # Run agent, streaming each chunk to stdout as it arrives so the
+        # first token shows up after one network round-trip
+        streamed = False
+        sys.stdout.write("\nAgent: ")
+        async for event in runner.run_async(
+            session_id=session_id,
+            user_id=user_id,
+            new_message=user_message,
+        ):
+            # EAFP: direct attribute access is cheaper than hasattr
+            # chains on this per-event hot loop
+            try:
+                parts = event.content.parts
+            except AttributeError:
+                continue
+            if not parts:
+                continue
+            for part in parts:
+                text = getattr(part, 'text', None)
+                if text:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                    streamed = True
+                    continue
+                function_response = getattr(part, 'function_response', None)
+                if function_response and function_response.response:
+                    result = function_response.response.get('result')
+                    if result:
+                        sys.stdout.write(f"\n[Tool Result]: {result}\n")
+                        sys.stdout.flush()
+                        streamed = True
+
+        if streamed:
+            print("\n")
+        else:
+            print("[INFO] Agent didn't respond with text.\n")
+
+
+async def run_agent_chat_with_executor(session_id: str):
+    """Run interactive chat using ADKAgentExecutor for proper UCP handling."""
+    d = _deps()
+
     print_header("UCP Shopping Agent (with Executor)")
     print(f"Session ID: {session_id}")
     print("Type 'quit' or ':q' to exit\n")
-    
+
     try:
         # Build agent with MCP tools
         print_info("Loading agent and MCP tools...")
-        agent = await build_agent()
+        agent = await get_agent_cached()
         print_success(f"Agent loaded with {len(agent.tools)} tool(s)")
-        
+
         # Create executor with UCP extension
-        ucp_extension = AgentExtension(
-            uri=UcpExtension.URI,
+        ucp_extension = d.AgentExtension(
+            uri=d.UcpExtension.URI,
             description="UCP Shopping Extension"
         )
-        executor = ADKAgentExecutor(agent, extensions=[ucp_extension])
+        executor = d.ADKAgentExecutor(agent, extensions=[ucp_extension])
         print_success("ADKAgentExecutor initialized")
-        
+
         # Create session using executor's session service
         user_id = "cli_user"
         session = await executor.runner.session_service.create_session(
@@ -100,59 +241,12 @@ async def run_agent_chat_with_executor(session_id: str):
             session_id=session_id,
         )
         print_success(f"Session created: {session.id}")
-        
+
         print_success("Ready for chat!\n")
-        
-        while True:
-            try:
-                # Get user input
-                user_input = input("You: ")
-                
-                if user_input.strip().lower() in ["quit", ":q", "exit"]:
-                    print("Goodbye!")
-                    break
-                
-                if not user_input.strip():
-                    continue
-                
-                # Create user message and run via Runner directly
-                # (ADKAgentExecutor requires A2A server context)
-                user_message = types.Content(
-                    parts=[types.Part(text=user_input)],
-                    role="user"
-                )
-                
-                print_info("Thinking...")
-                
-                # Run agent
-                response_parts = []
-                async for event in executor.runner.run_async(
-                    session_id=session_id,
-                    user_id="cli_user",
-                    new_message=user_message,
-                ):
-                    if hasattr(event, 'content') and event.content:
-                        if hasattr(event.content, 'parts'):
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    response_parts.append(part.text)
-                                elif hasattr(part, 'function_response'):
-                                    if part.function_response and part.function_response.response:
-                                        result = part.function_response.response.get('result')
-                                        if result:
-                                            response_parts.append(f"\n[Tool Result]: {result}")
-                
-                # Display response
-                if response_parts:
-                    response = "\n".join(response_parts)
-                    print(f"\nAgent: {response}\n")
-                else:
-                    print("[INFO] Agent didn't respond with text.\n")
-                    
-            except KeyboardInterrupt:
-                print("\n[INFO] Interrupted. Type 'quit' to exit.")
-                continue
-                
+
+        # Run via Runner directly (ADKAgentExecutor requires A2A server context)
+        await _chat_loop(executor.runner, session_id, user_id)
+
     except Exception as e:
         print_error(str(e))
         import traceback
@@ -161,82 +255,37 @@ async def run_agent_chat_with_executor(session_id: str):
 
 async def run_agent_chat_simple(session_id: str):
     """Run interactive chat with the agent (simple mode without executor)."""
-    from backend.host_agent.agent import build_agent
-    from google.adk.runners import Runner
-    from google.adk.sessions import InMemorySessionService
-    from google.genai import types
-    
+    d = _deps()
+
     print_header("UCP Shopping Agent (Simple Mode)")
     print(f"Session ID: {session_id}")
     print("Type 'quit' or ':q' to exit\n")
-    
+
     try:
         # Build agent with MCP tools
         print_info("Loading agent and MCP tools...")
-        agent = await build_agent()
+        agent = await get_agent_cached()
         print_success(f"Agent loaded with {len(agent.tools)} tool(s)")
-        
+
         # Create session service and runner
-        session_service = InMemorySessionService()
-        runner = Runner(
+        session_service = d.InMemorySessionService()
+        runner = d.Runner(
             agent=agent,
             app_name="ucp_shopping_app",
             session_service=session_service,
         )
-        
+
         # Create session
         session = await session_service.create_session(
             app_name="ucp_shopping_app",
             user_id="cli_user",
             session_id=session_id,
         )
-        
+
         print_success("Session created\n")
-        
-        while True:
-            try:
-                # Get user input
-                user_input = input("You: ")
-                
-                if user_input.strip().lower() in ["quit", ":q", "exit"]:
-                    print("Goodbye!")
-                    break
-                
-                if not user_input.strip():
-                    continue
-                
-                # Create user message
-                user_message = types.Content(
-                    parts=[types.Part(text=user_input)],
-                    role="user"
-                )
-                
-                # Run agent
-                print_info("Thinking...")
-                
-                response_parts = []
-                async for event in runner.run_async(
-                    session_id=session_id,
-                    user_id="cli_user",
-                    new_message=user_message,
-                ):
-                    if hasattr(event, 'content') and event.content:
-                        if hasattr(event.content, 'parts'):
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    response_parts.append(part.text)
-                
-                # Display response
-                if response_parts:
-                    response = "\n".join(response_parts)
-                    print(f"\nAgent: {response}\n")
-                else:
-                    print("[INFO] Agent didn't respond with text.\n")
-                    
-            except KeyboardInterrupt:
-                print("\n[INFO] Interrupted. Type 'quit' to exit.")
-                continue
-                
+
+        await _chat_loop(runner, session_id)
+
     except Exception as e:
         print_error(str(e))
         raise
@@ -244,17 +293,14 @@ async def run_agent_chat_simple(session_id: str):
 
 async def run_test():
     """Run a quick test of the agent system."""
-    from backend.host_agent.agent import build_agent
-    from backend.host_agent.agent_executor import ADKAgentExecutor
-    from backend.extensions.ucp_extension import UcpExtension
-    from a2a.types import AgentExtension
-    
+    d = _deps()
+
     print_header("System Test")
     
     try:
         # Test 1: Build agent
         print_info("1. Building agent...")
-        agent = await build_agent()
+        agent = await get_agent_cached()
         print_success(f"Agent '{agent.name}' created")
         
         # Test 2: Check tools
@@ -269,11 +315,11 @@ async def run_test():
         
         # Test 4: Create executor
         print_info("4. Creating ADKAgentExecutor...")
-        ucp_extension = AgentExtension(
-            uri=UcpExtension.URI,
+        ucp_extension = d.AgentExtension(
+            uri=d.UcpExtension.URI,
             description="UCP Shopping Extension"
         )
-        executor = ADKAgentExecutor(agent, extensions=[ucp_extension])
+        executor = d.ADKAgentExecutor(agent, extensions=[ucp_extension])
         print_success("Executor created successfully")
         
         print("\n[SUCCESS] All tests passed!")
@@ -284,68 +330,116 @@ async def run_test():
         traceback.print_exc()
 
 
+# Shared MCP probe client: keepalive + HTTP/2 lets repeated probes reuse one
+# TCP/TLS connection instead of re-handshaking per invocation.
+_MCP_CLIENT = None
+
+
+def _get_mcp_client():
+    """Lazily create the shared httpx.AsyncClient for MCP probes."""
+    global _MCP_CLIENT
+    if _MCP_CLIENT is None:
+        import httpx
+
+        _MCP_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream",
+            },
+        )
+    return _MCP_CLIENT
+
+
+async def _probe_list_tools(client, mcp_url: str) -> list:
+    """Probe tools/list and collect printable result lines."""
+    import json
+
+    response = await client.post(
+        mcp_url,
+        json={"jsonrpc": "2.0", "method": "tools/list", "id": 1},
+    )
+
+    lines = []
+    if response.status_code == 200:
+        lines.append(("ok", "MCP Server responding"))
+
+        # Parse SSE response in one pass without intermediate lists
+        _, _, tail = response.text.partition("data: ")
+        data, _, _ = tail.partition("\r")
+        result = json.loads(data)
+        tools = result.get("result", {}).get("tools", [])
+
+        lines.append(("ok", f"Found {len(tools)} tools"))
+        for tool in tools:
+            lines.append(("plain", f"   - {tool['name']}"))
+    else:
+        lines.append(("error", f"Server returned {response.status_code}"))
+    return lines
+
+
+async def _probe_search_products(client, mcp_url: str) -> list:
+    """Probe a search_products tool call and collect printable result lines."""
+    response = await client.post(
+        mcp_url,
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
+                "name": "search_products",
+                "arguments": {"query": "chips"}
+            },
+            "id": 2
+        },
+    )
+
+    if response.status_code == 200:
+        return [("ok", "search_products working")]
+    return [("error", "search_products failed")]
+
+
+def _render_probe_lines(lines: list):
+    """Print probe output lines in a stable order."""
+    for kind, text in lines:
+        if kind == "ok":
+            print_success(text)
+        elif kind == "error":
+            print_error(text)
+        else:
+            print(text)
+
+
 async def run_mcp_test():
     """Test MCP server connection directly."""
-    import httpx
-    import json
-    
     print_header("MCP Server Test")
-    
+
     mcp_url = "http://localhost:10999/mcp"
-    
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Test 1: List tools
-            print_info("1. Listing MCP tools...")
-            response = await client.post(
-                mcp_url,
-                json={"jsonrpc": "2.0", "method": "tools/list", "id": 1},
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                }
-            )
-            
-            if response.status_code == 200:
-                print_success("MCP Server responding")
-                
-                # Parse SSE response
-                data = response.text.split("data: ")[1].split("\r")[0]
-                result = json.loads(data)
-                tools = result.get("result", {}).get("tools", [])
-                
-                print_success(f"Found {len(tools)} tools")
-                for tool in tools:
-                    print(f"   - {tool['name']}")
-            else:
-                print_error(f"Server returned {response.status_code}")
-                
-            # Test 2: Search products
-            print_info("\n2. Testing search_products...")
-            response = await client.post(
-                mcp_url,
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tools/call",
-                    "params": {
-                        "name": "search_products",
-                        "arguments": {"query": "chips"}
-                    },
-                    "id": 2
-                },
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                }
-            )
-            
-            if response.status_code == 200:
-                print_success("search_products working")
-            else:
-                print_error("search_products failed")
-                
+        client = _get_mcp_client()
+
+        # The two probes are independent - overlap them so total wall-time is
+        # max(RTT) instead of the sum
+        list_result, search_result = await asyncio.gather(
+            _probe_list_tools(client, mcp_url),
+            _probe_search_products(client, mcp_url),
+            return_exceptions=True,
+        )
+
+        print_info("1. Listing MCP tools...")
+        if isinstance(list_result, Exception):
+            raise list_result
+        _render_probe_lines(list_result)
+
+        print_info("\n2. Testing search_products...")
+        if isinstance(search_result, Exception):
+            raise search_result
+        _render_probe_lines(search_result)
+
         print("\n[SUCCESS] MCP Server is healthy!")
-        
+
     except Exception as e:
         if "ConnectError" in str(type(e)):
             print_error("Cannot connect to MCP Server at localhost:10999")
@@ -355,6 +449,45 @@ async def run_mcp_test():
             print_error(f"Error: {e}")
 
 
+# One event loop for the whole CLI lifetime, so the cached agent and the
+# keepalive MCP client survive across commands instead of being torn down
+# by per-command asyncio.run() calls.
+_loop = None
+
+
+def _get_loop():
+    """Create the CLI's persistent event loop on first use."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_loop.close)
+    return _loop
+
+
+def _run(coro):
+    """Run a coroutine on the CLI's persistent event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+def _run_chat(coro):
+    """Run the chat REPL, resuming it after a Ctrl-C at the prompt.
+
+    With the stdin read on an executor, a Ctrl-C surfaces here — it
+    escapes run_until_complete while the chat task stays suspended on
+    its stdin future. Re-running the loop with the same task resumes
+    the REPL where it left off, keeping the single in-flight reader
+    instead of killing the chat with a traceback.
+    """
+    loop = _get_loop()
+    task = loop.create_task(coro)
+    while True:
+        try:
+            return loop.run_until_complete(task)
+        except KeyboardInterrupt:
+            print("\n[INFO] Interrupted. Type 'quit' to exit.")
+
+
 @click.group()
 def cli():
     """UCP Shopping Agent CLI"""
@@ -368,21 +501,21 @@ def chat(session: Optional[str], simple: bool):
     """Start interactive chat with the shopping agent."""
     session_id = session or uuid4().hex
     if simple:
-        asyncio.run(run_agent_chat_simple(session_id))
+        _run_chat(run_agent_chat_simple(session_id))
     else:
-        asyncio.run(run_agent_chat_with_executor(session_id))
+        _run_chat(run_agent_chat_with_executor(session_id))
 
 
 @cli.command()
 def test():
     """Run a quick test of the agent system."""
-    asyncio.run(run_test())
+    _run(run_test())
 
 
 @cli.command()
 def mcp():
     """Test MCP server connection."""
-    asyncio.run(run_mcp_test())
+    _run(run_mcp_test())
 
 
 @cli.command()
@@ -392,13 +525,10 @@ def server():
     print("URL: http://localhost:10999")
     print("Press Ctrl+C to stop\n")
     
-    import subprocess
-    subprocess.run([
-        sys.executable, "-c",
-        "import sys; sys.path.insert(0, '.'); sys.path.insert(0, 'sdk/python/src'); "
-        "from backend.mcp_server.streamable_http_server import mcp; "
-        "mcp.run(transport='streamable-http')"
-    ])
+    # Run in-process: spawning a second interpreter buys no isolation here
+    # and costs a full CPython startup plus a re-import of the server stack
+    from backend.mcp_server.streamable_http_server import mcp as mcp_server
+    mcp_server.run(transport='streamable-http')
 
 
 if __name__ == "__main__":
@@ -37,12 +37,17 @@ import hashlib
 import json
 import logging
 import re
+import string
+import threading
+from collections import OrderedDict
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 from uuid import uuid4
 from datetime import datetime, timezone
 
+from .constants import AP2_CAPABILITY_NAME, AP2_VERSION
+
 try:
     from cryptography.hazmat.primitives import hashes, serialization
     from cryptography.hazmat.primitives.asymmetric import ec
@@ -51,11 +56,73 @@ try:
 except ImportError:
     HAS_CRYPTOGRAPHY = False
 
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Hash objects are pooled per thread: copying a prepared template is a
+# C-level memcpy of the hash state, cheaper than constructing a fresh
+# object for every ~100 B signing input
+_hash_local = threading.local()
+
+
+def _pooled_blake2b(data: bytes, digest_size: int) -> bytes:
+    """Hash data with a thread-local blake2b template for the given size."""
+    templates = getattr(_hash_local, 'blake2b', None)
+    if templates is None:
+        templates = _hash_local.blake2b = {}
+    template = templates.get(digest_size)
+    if template is None:
+        template = templates[digest_size] = hashlib.blake2b(digest_size=digest_size)
+    h = template.copy()
+    h.update(data)
+    return h.digest()
+
+
+try:
+    from blake3 import blake3 as _blake3
+
+    def _fast_hash(data: bytes) -> bytes:
+        """SIMD-accelerated hash for mock signatures and cache keys."""
+        return _blake3(data).digest()
+except ImportError:
+    def _fast_hash(data: bytes) -> bytes:
+        """SIMD-accelerated hash for mock signatures and cache keys."""
+        return _pooled_blake2b(data, 32)
+
 logger = logging.getLogger(__name__)
 
+# Max entries kept in the per-signer signature cache
+_SIG_CACHE_MAX = 1024
+
+# Detached JWS format: <base64url-header>..<base64url-signature>
+_DETACHED_JWS_RE = re.compile(r'^([A-Za-z0-9_-]+)\.\.([A-Za-z0-9_-]+)$')
+
+# SD-JWT+kb format: <header>.<payload>.<signature>[~<disclosure>...]
+_MANDATE_RE = re.compile(
+    r'^[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+(~[A-Za-z0-9_-]+)*$'
+)
+
+# Deletion table for base64url alphabet validation: translate() runs one
+# C-level scan, far cheaper than a regex or a per-character Python loop
+# even for mandates carrying many KB of disclosures
+_B64URL_DELETE = str.maketrans('', '', string.ascii_letters + string.digits + '-_')
+
+# Same table with '~' allowed, for scanning an SD-JWT disclosures tail
+# without splitting it into a list first
+_B64URL_TILDE_DELETE = str.maketrans('', '', string.ascii_letters + string.digits + '-_~')
 
-AP2_VERSION = "2026-01-11"
-AP2_CAPABILITY_NAME = "dev.ucp.shopping.ap2_mandate"
+
+def is_base64url(value: str) -> bool:
+    """Check that value contains only base64url alphabet characters."""
+    return not value.translate(_B64URL_DELETE)
 
 
 class Ap2ErrorCode(str, Enum):
@@ -76,6 +143,20 @@ class SignatureAlgorithm(str, Enum):
     ES512 = "ES512"
 
 
+# Precomputed so verification does an O(1) membership test instead of
+# rebuilding a list of enum values per call
+_SUPPORTED_ALGS = frozenset(a.value for a in SignatureAlgorithm)
+
+if HAS_CRYPTOGRAPHY:
+    # Map to the hash classes, not instances: the cryptography API wants a
+    # fresh hash object per signature
+    _HASH_ALG_MAP = {
+        SignatureAlgorithm.ES256: hashes.SHA256,
+        SignatureAlgorithm.ES384: hashes.SHA384,
+        SignatureAlgorithm.ES512: hashes.SHA512,
+    }
+
+
 class Ap2CheckoutResponse(BaseModel):
     """
     The ap2 object included in CREATE/UPDATE checkout responses.
@@ -86,9 +167,17 @@ class Ap2CheckoutResponse(BaseModel):
     merchant_authorization: str = Field(
         ...,
         description="JWS Detached Content signature over checkout (excluding ap2 field)",
-        pattern=r"^[A-Za-z0-9_-]+\.\.[A-Za-z0-9_-]+$"
     )
 
+    @field_validator('merchant_authorization')
+    @classmethod
+    def _validate_format(cls, v: str) -> str:
+        # Module-level compiled pattern shared with the verifier, rather
+        # than a per-model pattern= clone
+        if not _DETACHED_JWS_RE.match(v):
+            raise ValueError("merchant_authorization is not a detached JWS")
+        return v
+
 
 class Ap2CompleteRequest(BaseModel):
     """
@@ -100,9 +189,15 @@ class Ap2CompleteRequest(BaseModel):
     checkout_mandate: str = Field(
         ...,
         description="SD-JWT+kb credential proving user authorization",
-        pattern=r"^[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+(~[A-Za-z0-9_-]+)*$"
     )
 
+    @field_validator('checkout_mandate')
+    @classmethod
+    def _validate_format(cls, v: str) -> str:
+        if not _MANDATE_RE.match(v):
+            raise ValueError("checkout_mandate is not an SD-JWT+kb credential")
+        return v
+
 
 class Ap2CapabilityConfig(BaseModel):
     """Configuration for AP2 capability in UCP profile."""
@@ -136,23 +231,28 @@ class SigningKey(BaseModel):
 
 def base64url_encode(data: bytes) -> str:
     """Encode bytes to base64url without padding."""
-    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+    return _b64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
 
 
-def base64url_decode(data: str) -> bytes:
-    """Decode base64url string to bytes."""
-    padding = 4 - len(data) % 4
-    if padding != 4:
-        data += '=' * padding
-    return base64.urlsafe_b64decode(data)
+def base64url_decode(data) -> bytes:
+    """Decode a base64url str or bytes to bytes."""
+    # (-n) & 3 is the branchless form of the pad-to-multiple-of-4 rule
+    if isinstance(data, bytes):
+        return _b64.urlsafe_b64decode(data + b'=' * ((-len(data)) & 3))
+    return _b64.urlsafe_b64decode(data + '=' * ((-len(data)) & 3))
 
 
 def jcs_canonicalize(obj: Any) -> bytes:
     """
     JSON Canonicalization Scheme (JCS) per RFC 8785.
-    
+
     Produces deterministic, byte-for-byte identical JSON representation.
+    Uses orjson when available: its native encoder sorts keys, emits compact
+    UTF-8 bytes directly, and rejects NaN/Inf, matching the stdlib settings
+    below at a fraction of the serialization cost.
     """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
     return json.dumps(
         obj,
         ensure_ascii=False,
@@ -163,8 +263,49 @@ def jcs_canonicalize(obj: Any) -> bytes:
     ).encode('utf-8')
 
 
+# Sorted top-level key order memoized per checkout shape; checkout objects
+# on the signing path share a handful of stable shapes, so the sort runs
+# once per shape instead of once per sign
+_JCS_SHAPE_CACHE: Dict[frozenset, Tuple[str, ...]] = {}
+
+
+def jcs_canonicalize_checkout(checkout: Dict[str, Any]) -> bytes:
+    """
+    JCS canonicalization specialized for top-level checkout dicts.
+
+    Serializes the top level key-by-key in a memoized sorted order, letting
+    orjson handle each (sorted) subtree. Falls back to the generic
+    jcs_canonicalize without orjson. Mandate verification keeps the generic
+    path; only the merchant_authorization signing path is hot enough to care.
+    """
+    if not HAS_ORJSON:
+        return jcs_canonicalize(checkout)
+    shape = frozenset(checkout)
+    keys = _JCS_SHAPE_CACHE.get(shape)
+    if keys is None:
+        keys = tuple(sorted(checkout))
+        _JCS_SHAPE_CACHE[shape] = keys
+    parts = []
+    for key in keys:
+        parts.append(orjson.dumps(key))
+        parts.append(b':')
+        parts.append(orjson.dumps(checkout[key], option=orjson.OPT_SORT_KEYS))
+        parts.append(b',')
+    if parts:
+        parts[-1] = b'}'
+        return b'{' + b''.join(parts)
+    return b'{}'
+
+
+_MISSING = object()
+
+
 def remove_ap2_field(checkout: Dict[str, Any]) -> Dict[str, Any]:
-    """Remove the ap2 field from checkout for signature computation."""
+    """Remove the ap2 field from checkout for signature computation.
+
+    Returns a copy; the signing hot path avoids this by transiently popping
+    the field instead (see MerchantAuthorizationSigner.sign_checkout).
+    """
     result = checkout.copy()
     result.pop('ap2', None)
     return result
@@ -198,6 +339,18 @@ class MerchantAuthorizationSigner:
         self.kid = kid
         self.algorithm = algorithm
         self._use_mock = private_key is None or not HAS_CRYPTOGRAPHY
+        # Checkouts are frequently re-signed after no-op updates; cache the
+        # detached JWS keyed by a digest of the canonical bytes so repeat
+        # signs of identical payloads skip the ECDSA operation entirely.
+        self._sig_cache: OrderedDict = OrderedDict()
+        # The protected header only depends on alg/kid, so encode it once.
+        # kid and algorithm are treated as frozen after construction; build
+        # a new signer rather than mutating them, or the header goes stale.
+        header = {"alg": self.algorithm.value, "kid": self.kid}
+        header_bytes = (
+            orjson.dumps(header) if HAS_ORJSON else json.dumps(header).encode('utf-8')
+        )
+        self._encoded_header = base64url_encode(header_bytes)
     
     def sign_checkout(self, checkout: Dict[str, Any]) -> str:
         """
@@ -209,19 +362,29 @@ class MerchantAuthorizationSigner:
         Returns:
             Detached JWS string: <header>..<signature>
         """
-        # Remove ap2 field for signature computation
-        payload = remove_ap2_field(checkout)
-        
-        # Canonicalize using JCS
-        canonical_bytes = jcs_canonicalize(payload)
-        
-        # Create protected header
-        header = {
-            "alg": self.algorithm.value,
-            "kid": self.kid
-        }
-        encoded_header = base64url_encode(json.dumps(header).encode('utf-8'))
-        
+        # Exclude the ap2 field without shallow-copying the whole checkout:
+        # pop it for the canonicalization pass and restore it afterwards
+        ap2_value = checkout.pop('ap2', _MISSING)
+        try:
+            canonical_bytes = jcs_canonicalize_checkout(checkout)
+        finally:
+            if ap2_value is not _MISSING:
+                checkout['ap2'] = ap2_value
+
+        # Check the signature cache before signing
+        cache_key = (
+            self.kid,
+            self.algorithm.value,
+            _pooled_blake2b(canonical_bytes, 16),
+        )
+        cached = self._sig_cache.get(cache_key)
+        if cached is not None:
+            self._sig_cache.move_to_end(cache_key)
+            return cached
+
+        # Protected header is precomputed in __init__
+        encoded_header = self._encoded_header
+
         # Create signing input
         encoded_payload = base64url_encode(canonical_bytes)
         signing_input = f"{encoded_header}.{encoded_payload}".encode('utf-8')
@@ -235,11 +398,21 @@ class MerchantAuthorizationSigner:
         
         # Return detached JWS (header..signature, no payload)
         encoded_signature = base64url_encode(signature)
-        return f"{encoded_header}..{encoded_signature}"
+        detached_jws = f"{encoded_header}..{encoded_signature}"
+
+        self._sig_cache[cache_key] = detached_jws
+        if len(self._sig_cache) > _SIG_CACHE_MAX:
+            self._sig_cache.popitem(last=False)
+
+        return detached_jws
     
     def _mock_sign(self, signing_input: bytes) -> bytes:
-        """Create a mock signature using SHA-256 hash."""
-        return hashlib.sha256(signing_input).digest()
+        """Create a mock signature using a fast content hash.
+
+        Real ES256/384/512 signatures go through _real_sign; the mock path is
+        demo-only, so a SIMD hash (BLAKE3/BLAKE2b) beats scalar SHA-256.
+        """
+        return _fast_hash(signing_input)
     
     def _real_sign(self, signing_input: bytes) -> bytes:
         """Create a real ECDSA signature."""
@@ -247,12 +420,8 @@ class MerchantAuthorizationSigner:
             raise RuntimeError("cryptography library required for real signing")
         
         # Select hash algorithm based on signature algorithm
-        hash_alg = {
-            SignatureAlgorithm.ES256: hashes.SHA256(),
-            SignatureAlgorithm.ES384: hashes.SHA384(),
-            SignatureAlgorithm.ES512: hashes.SHA512(),
-        }[self.algorithm]
-        
+        hash_alg = _HASH_ALG_MAP[self.algorithm]()
+
         signature = self.private_key.sign(
             signing_input,
             ec.ECDSA(hash_alg)
@@ -276,10 +445,85 @@ class MandateVerifier:
             signing_keys: Platform signing keys for verification
         """
         self.signing_keys = signing_keys or []
-        self._key_map: Dict[str, SigningKey] = {
-            key.kid: key for key in self.signing_keys
-        }
-    
+        # Structure-of-arrays layout: verification only touches the decoded
+        # point coordinates and algorithm, so those live in parallel lists
+        # indexed via _kid_index rather than behind Pydantic attribute
+        # dispatch on the full SigningKey models.
+        self._kids: List[str] = []
+        self._x_bytes: List[bytes] = []
+        self._y_bytes: List[bytes] = []
+        self._algs: List[str] = []
+        self._kid_index: Dict[str, int] = {}
+        for key in self.signing_keys:
+            self._kid_index[key.kid] = len(self._kids)
+            self._kids.append(key.kid)
+            self._x_bytes.append(base64url_decode(key.x))
+            self._y_bytes.append(base64url_decode(key.y))
+            self._algs.append(key.alg)
+        # JWK -> EllipticCurvePublicKey expansion is expensive; memoize it
+        # per kid so batch verification pays the decode cost once per key.
+        self._pubkey_cache: Dict[str, Any] = {}
+
+    def _get_public_key(self, kid: str) -> Optional[Any]:
+        """Return the expanded EC public key for kid, caching the result."""
+        pubkey = self._pubkey_cache.get(kid)
+        if pubkey is not None:
+            return pubkey
+        index = self._kid_index.get(kid)
+        if index is None or not HAS_CRYPTOGRAPHY:
+            return None
+        pubkey = ec.EllipticCurvePublicNumbers(
+            int.from_bytes(self._x_bytes[index], 'big'),
+            int.from_bytes(self._y_bytes[index], 'big'),
+            ec.SECP256R1(),
+        ).public_key(default_backend())
+        self._pubkey_cache[kid] = pubkey
+        return pubkey
+
+    def verify_batch(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Verify several checkout mandates in one pass.
+
+        Groups mandates by the kid in their JWT header so each platform key
+        is expanded from JWK coordinates at most once (via _get_public_key),
+        then verifies each mandate in its original order.
+
+        Args:
+            items: List of (mandate, expected_checkout) pairs
+
+        Returns:
+            List of (is_valid, error_message) tuples, one per input pair
+        """
+        results: List[Optional[Tuple[bool, Optional[str]]]] = [None] * len(items)
+        by_kid: Dict[Optional[str], List[int]] = {}
+        for index, (mandate, _) in enumerate(items):
+            try:
+                header_b64 = mandate.partition('~')[0].partition('.')[0]
+                header = json.loads(base64url_decode(header_b64))
+                kid = header.get('kid')
+            except Exception:
+                kid = None
+            by_kid.setdefault(kid, []).append(index)
+
+        for kid, indices in by_kid.items():
+            if kid is not None:
+                # Warm the per-kid public key cache before the group runs
+                self._get_public_key(kid)
+            for index in indices:
+                mandate, expected_checkout = items[index]
+                results[index] = self.verify_mandate(mandate, expected_checkout)
+
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def validate_format_batch(mandates: List[str]) -> List[bool]:
+        """Structurally validate many mandates with one precompiled pattern."""
+        match = _MANDATE_RE.match
+        return [match(m) is not None for m in mandates]
+
     def verify_mandate(
         self,
         mandate: str,
@@ -296,18 +540,25 @@ class MandateVerifier:
             Tuple of (is_valid, error_message)
         """
         try:
-            # Parse SD-JWT+kb structure
-            parts = mandate.split('~')
-            jwt_part = parts[0]
-            disclosures = parts[1:] if len(parts) > 1 else []
-            
+            # Parse SD-JWT+kb structure. Mandates with many disclosures run
+            # to several KB; partition() looks at the head without building
+            # a list of every disclosure up front.
+            jwt_part, _, disclosures_str = mandate.partition('~')
+
             # Split JWT into header.payload.signature
-            jwt_sections = jwt_part.split('.')
-            if len(jwt_sections) != 3:
+            header_b64, _, rest = jwt_part.partition('.')
+            payload_b64, _, signature_b64 = rest.partition('.')
+            if not header_b64 or not signature_b64 or '.' in signature_b64:
                 return False, "Invalid JWT structure"
-            
-            header_b64, payload_b64, signature_b64 = jwt_sections
-            
+
+            # Validate the base64url alphabet up front: the JWT sections
+            # individually, the disclosures tail in one scan (split lazily
+            # with disclosures_str.split('~') only where needed)
+            if not all(
+                is_base64url(s) for s in (header_b64, payload_b64, signature_b64) if s
+            ) or disclosures_str.translate(_B64URL_TILDE_DELETE):
+                return False, "Invalid base64url encoding in mandate"
+
             # Decode header
             header = json.loads(base64url_decode(header_b64))
             
@@ -345,7 +596,7 @@ class MandateVerifier:
         """
         try:
             # Parse detached JWS: header..signature
-            match = re.match(r'^([A-Za-z0-9_-]+)\.\.([A-Za-z0-9_-]+)$', authorization)
+            match = _DETACHED_JWS_RE.match(authorization)
             if not match:
                 return False, "Invalid merchant_authorization format"
             
@@ -356,7 +607,7 @@ class MandateVerifier:
             alg = header.get('alg')
             kid = header.get('kid')
             
-            if alg not in [a.value for a in SignatureAlgorithm]:
+            if alg not in _SUPPORTED_ALGS:
                 return False, f"Unsupported algorithm: {alg}"
             
             logger.info(f"Merchant authorization: alg={alg}, kid={kid}")
@@ -446,20 +697,26 @@ class Ap2Session:
         return True, None, None
 
 
-def create_ap2_capability() -> Dict[str, Any]:
-    """Create AP2 capability object for UCP profile."""
-    return {
-        "name": AP2_CAPABILITY_NAME,
-        "version": AP2_VERSION,
-        "spec": "https://ucp.dev/specification/ap2-mandates",
-        "schema": "https://ucp.dev/schemas/shopping/ap2_mandate.json",
-        "extends": "dev.ucp.shopping.checkout",
-        "config": {
-            "vp_formats_supported": {
-                "dc+sd-jwt": {}
-            }
+# Built once at import; create_ap2_capability hands out shallow copies so
+# capability negotiation doesn't rebuild the literal (and its sub-dicts)
+# on every call. Callers must not mutate the nested config.
+_AP2_CAPABILITY_TEMPLATE: Dict[str, Any] = {
+    "name": AP2_CAPABILITY_NAME,
+    "version": AP2_VERSION,
+    "spec": "https://ucp.dev/specification/ap2-mandates",
+    "schema": "https://ucp.dev/schemas/shopping/ap2_mandate.json",
+    "extends": "dev.ucp.shopping.checkout",
+    "config": {
+        "vp_formats_supported": {
+            "dc+sd-jwt": {}
         }
     }
+}
+
+
+def create_ap2_capability() -> Dict[str, Any]:
+    """Create AP2 capability object for UCP profile."""
+    return {**_AP2_CAPABILITY_TEMPLATE}
 
 
 def is_ap2_active(platform_capabilities: List[str]) -> bool:
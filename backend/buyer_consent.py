@@ -42,14 +42,18 @@ Usage:
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import logging
 
+from .constants import UCP_BUYER_CONSENT_EXTENSION as BUYER_CONSENT_CAPABILITY_NAME
+
 logger = logging.getLogger(__name__)
 
 
 BUYER_CONSENT_VERSION = "2026-01-11"
-BUYER_CONSENT_CAPABILITY_NAME = "dev.ucp.shopping.buyer_consent"
+
+# Hoisted so has_any_consent compares against one preallocated tuple
+_ALL_NONE = (None, None, None, None)
 
 
 class BuyerConsent(BaseModel):
@@ -58,7 +62,13 @@ class BuyerConsent(BaseModel):
     
     All fields are optional - absence means consent state is unknown/not provided.
     Businesses should handle missing consent according to their default policies.
+
+    The model is frozen: consent never changes after extraction (updates go
+    through merge_consent, which builds a new instance), which lets to_dict
+    cache its result across repeated checkout updates.
     """
+    model_config = ConfigDict(frozen=True)
+
     analytics: Optional[bool] = Field(
         None,
         description="Consent for analytics and tracking (e.g., Google Analytics)"
@@ -78,16 +88,16 @@ class BuyerConsent(BaseModel):
     
     def has_any_consent(self) -> bool:
         """Check if any consent has been explicitly provided."""
-        return any([
-            self.analytics is not None,
-            self.preferences is not None,
-            self.marketing is not None,
-            self.sale_of_data is not None,
-        ])
+        # Single C-level tuple compare, short-circuiting at the first non-None
+        return (self.analytics, self.preferences, self.marketing, self.sale_of_data) != _ALL_NONE
     
     def to_dict(self) -> dict:
-        """Convert to dict, excluding None values."""
-        return {k: v for k, v in self.model_dump().items() if v is not None}
+        """Convert to dict, excluding None values (cached; the model is frozen)."""
+        cached = self.__dict__.get('_consent_dict')
+        if cached is None:
+            cached = {k: v for k, v in self.model_dump().items() if v is not None}
+            self.__dict__['_consent_dict'] = cached
+        return cached
 
 
 class BuyerWithConsent(BaseModel):
@@ -114,27 +124,43 @@ class BuyerConsentCapability(BaseModel):
     extends: str = "dev.ucp.shopping.checkout"
 
 
+# Built once at import; handed out as shallow copies during capability
+# negotiation instead of rebuilding the literal per call
+_BUYER_CONSENT_CAPABILITY_TEMPLATE = {
+    "name": BUYER_CONSENT_CAPABILITY_NAME,
+    "version": BUYER_CONSENT_VERSION,
+    "extends": "dev.ucp.shopping.checkout"
+}
+
+
 def create_buyer_consent_capability() -> dict:
     """Create Buyer Consent capability for UCP profile."""
-    return {
-        "name": BUYER_CONSENT_CAPABILITY_NAME,
-        "version": BUYER_CONSENT_VERSION,
-        "extends": "dev.ucp.shopping.checkout"
-    }
+    return {**_BUYER_CONSENT_CAPABILITY_TEMPLATE}
+
+
+_CONSENT_FIELDS = frozenset(("analytics", "preferences", "marketing", "sale_of_data"))
 
 
 def extract_consent_from_buyer(buyer: dict) -> Optional[BuyerConsent]:
     """
     Extract consent object from buyer data.
-    
+
     Args:
         buyer: Buyer dictionary that may contain consent
-        
+
     Returns:
         BuyerConsent object or None if no consent provided
     """
     consent_data = buyer.get("consent")
     if consent_data:
+        # Consent dicts are tiny and arrive on every checkout update; when the
+        # payload is already well-formed (known keys, bool values) skip the
+        # full validation pipeline and build the model directly.
+        if isinstance(consent_data, dict) and all(
+            key in _CONSENT_FIELDS and type(value) is bool
+            for key, value in consent_data.items()
+        ):
+            return BuyerConsent.model_construct(**consent_data)
         return BuyerConsent.model_validate(consent_data)
     return None
 
@@ -156,6 +182,25 @@ def apply_consent_to_buyer(buyer: dict, consent: BuyerConsent) -> dict:
     return result
 
 
+def apply_consent_to_buyer_inplace(buyer: dict, consent: BuyerConsent) -> dict:
+    """
+    Add consent to a buyer object, mutating it in place.
+
+    Use this when the caller owns the dict (e.g. it was just built from a
+    request payload) and the copy in apply_consent_to_buyer would be wasted.
+
+    Args:
+        buyer: Buyer dictionary (mutated)
+        consent: BuyerConsent object
+
+    Returns:
+        The same buyer dictionary, with consent set
+    """
+    if consent and consent.has_any_consent():
+        buyer["consent"] = consent.to_dict()
+    return buyer
+
+
 def validate_consent_request(consent_data: dict) -> tuple[bool, Optional[str]]:
     """
     Validate consent data from a request.
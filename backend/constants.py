@@ -1,33 +1,65 @@
 
-from dataclasses import dataclass
-@dataclass
+from typing import Final
+
+# Module-level constants resolve through the module __dict__ (a single
+# LOAD_GLOBAL with CPython 3.11+ inline caches), which is cheaper than an
+# attribute lookup on a class. Prefer importing these names directly; the
+# Constants namespace below is kept for existing call sites.
+
+ADK_USER_CHECKOUT_ID: Final = "user:checkout_id"
+ADK_PAYMENT_STATE: Final = "__payment_data__"
+ADK_UCP_METADATA_STATE: Final = "__ucp_metadata__"
+ADK_EXTENSIONS_STATE_KEY: Final = "__session_extensions__"
+ADK_LATEST_TOOL_RESULT: Final = "temp:LATEST_TOOL_RESULT"
+
+A2A_UCP_EXTENSION_URL: Final = "https://ucp.dev/specification/reference?v=2026-01-11"
+
+UCP_AGENT_HEADER: Final = "UCP-Agent"
+UCP_FULFILLMENT_EXTENSION: Final = "dev.ucp.shopping.fulfillment"
+UCP_BUYER_CONSENT_EXTENSION: Final = "dev.ucp.shopping.buyer_consent"
+UCP_DISCOUNT_EXTENSION: Final = "dev.ucp.shopping.discount"
+
+UCP_CHECKOUT_KEY: Final = "a2a.ucp.checkout"
+UCP_PAYMENT_DATA_KEY: Final = "a2a.ucp.checkout.payment_data"
+UCP_RISK_SIGNALS_KEY: Final = "a2a.ucp.checkout.risk_signals"
+
+# EP Binding (Embedded Checkout Protocol) Constants
+EP_VERSION: Final = "2026-01-11"
+EP_DELEGATE_PAYMENT_INSTRUMENTS: Final = "payment.instruments_change"
+EP_DELEGATE_PAYMENT_CREDENTIAL: Final = "payment.credential"
+EP_DELEGATE_FULFILLMENT_ADDRESS: Final = "fulfillment.address_change"
+
+# AP2 Mandates Extension Constants
+AP2_VERSION: Final = "2026-01-11"
+AP2_CAPABILITY_NAME: Final = "dev.ucp.shopping.ap2_mandate"
+AP2_SPEC_URL: Final = "https://ucp.dev/specification/ap2-mandates"
+
+
 class Constants:
+    """Backward-compatible namespace over the module-level constants."""
+
+    ADK_USER_CHECKOUT_ID = ADK_USER_CHECKOUT_ID
+    ADK_PAYMENT_STATE = ADK_PAYMENT_STATE
+    ADK_UCP_METADATA_STATE = ADK_UCP_METADATA_STATE
+    ADK_EXTENSIONS_STATE_KEY = ADK_EXTENSIONS_STATE_KEY
+    ADK_LATEST_TOOL_RESULT = ADK_LATEST_TOOL_RESULT
+
+    A2A_UCP_EXTENSION_URL = A2A_UCP_EXTENSION_URL
+
+    UCP_AGENT_HEADER = UCP_AGENT_HEADER
+    UCP_FULFILLMENT_EXTENSION = UCP_FULFILLMENT_EXTENSION
+    UCP_BUYER_CONSENT_EXTENSION = UCP_BUYER_CONSENT_EXTENSION
+    UCP_DISCOUNT_EXTENSION = UCP_DISCOUNT_EXTENSION
+
+    UCP_CHECKOUT_KEY = UCP_CHECKOUT_KEY
+    UCP_PAYMENT_DATA_KEY = UCP_PAYMENT_DATA_KEY
+    UCP_RISK_SIGNALS_KEY = UCP_RISK_SIGNALS_KEY
 
-    ADK_USER_CHECKOUT_ID = "user:checkout_id"
-    ADK_PAYMENT_STATE = "__payment_data__"
-    ADK_UCP_METADATA_STATE = "__ucp_metadata__"
-    ADK_EXTENSIONS_STATE_KEY = "__session_extensions__"
-    ADK_LATEST_TOOL_RESULT = "temp:LATEST_TOOL_RESULT"
-
-    A2A_UCP_EXTENSION_URL = "https://ucp.dev/specification/reference?v=2026-01-11"
-
-    UCP_AGENT_HEADER = "UCP-Agent"
-    UCP_FULFILLMENT_EXTENSION = "dev.ucp.shopping.fulfillment"
-    UCP_BUYER_CONSENT_EXTENSION = "dev.ucp.shopping.buyer_consent"
-    UCP_DISCOUNT_EXTENSION = "dev.ucp.shopping.discount"
-
-    UCP_CHECKOUT_KEY = "a2a.ucp.checkout"
-    UCP_PAYMENT_DATA_KEY = "a2a.ucp.checkout.payment_data"
-    UCP_RISK_SIGNALS_KEY = "a2a.ucp.checkout.risk_signals"
-    
-    # EP Binding (Embedded Checkout Protocol) Constants
-    EP_VERSION = "2026-01-11"
-    EP_DELEGATE_PAYMENT_INSTRUMENTS = "payment.instruments_change"
-    EP_DELEGATE_PAYMENT_CREDENTIAL = "payment.credential"
-    EP_DELEGATE_FULFILLMENT_ADDRESS = "fulfillment.address_change"
-    
-    # AP2 Mandates Extension Constants
-    AP2_VERSION = "2026-01-11"
-    AP2_CAPABILITY_NAME = "dev.ucp.shopping.ap2_mandate"
-    AP2_SPEC_URL = "https://ucp.dev/specification/ap2-mandates"
+    EP_VERSION = EP_VERSION
+    EP_DELEGATE_PAYMENT_INSTRUMENTS = EP_DELEGATE_PAYMENT_INSTRUMENTS
+    EP_DELEGATE_PAYMENT_CREDENTIAL = EP_DELEGATE_PAYMENT_CREDENTIAL
+    EP_DELEGATE_FULFILLMENT_ADDRESS = EP_DELEGATE_FULFILLMENT_ADDRESS
 
+    AP2_VERSION = AP2_VERSION
+    AP2_CAPABILITY_NAME = AP2_CAPABILITY_NAME
+    AP2_SPEC_URL = AP2_SPEC_URL
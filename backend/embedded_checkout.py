@@ -36,29 +36,55 @@ Delegation Messages:
 - ec.fulfillment.address_change_request: Request address selection
 """
 
+from collections import deque
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from uuid import uuid4
 import json
+import re
+import secrets
 import logging
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize an EP message with orjson's C encoder."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        """Serialize an EP message with the stdlib encoder."""
+        return json.dumps(obj)
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
 EP_VERSION = "2026-01-11"
 
+# Upper bound on a single inbound EP message; anything larger is rejected
+# before JSON parsing
+MAX_EP_MESSAGE_BYTES = 1 << 20
+
+# ec_version format (YYYY-MM-DD); the old count('-') check let strings
+# like "a-b-c" through
+_EC_VERSION_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
 
 EP_DELEGATE_PAYMENT_INSTRUMENTS = "payment.instruments_change"
 EP_DELEGATE_PAYMENT_CREDENTIAL = "payment.credential"
 EP_DELEGATE_FULFILLMENT_ADDRESS = "fulfillment.address_change"
 
 
-SUPPORTED_DELEGATIONS = [
+SUPPORTED_DELEGATIONS = frozenset({
     EP_DELEGATE_PAYMENT_INSTRUMENTS,
     EP_DELEGATE_PAYMENT_CREDENTIAL,
     EP_DELEGATE_FULFILLMENT_ADDRESS,
-]
+})
 
 
 class JsonRpcMessage(BaseModel):
@@ -68,7 +94,9 @@ class JsonRpcMessage(BaseModel):
 
 class JsonRpcRequest(JsonRpcMessage):
     """JSON-RPC 2.0 request (with id, expects response)."""
-    id: str = Field(default_factory=lambda: uuid4().hex)
+    # Correlation IDs only need per-session uniqueness; token_hex(8) skips
+    # the full 16 bytes of CSPRNG entropy a UUID4 draws per message
+    id: str = Field(default_factory=lambda: secrets.token_hex(8))
     method: str
     params: Dict[str, Any] = Field(default_factory=dict)
 
@@ -145,7 +173,12 @@ class EcReadyResponseResult(BaseModel):
 
 
 class EcCheckoutParams(BaseModel):
-    """Parameters containing checkout state (used by multiple message types)."""
+    """Parameters containing checkout state (schema documentation only).
+
+    The message builders below inline the equivalent {"checkout": ...}
+    literal; wrapping a single pass-through dict in a model only to dump
+    it again added a validator pass per message.
+    """
     checkout: Dict[str, Any] = Field(
         ...,
         description="The latest state of the checkout"
@@ -186,6 +219,57 @@ class EPErrorCode(int, Enum):
 
 
 
+# Raw method strings for the message-emission hot path: a bare constant
+# skips the enum attribute load plus .value descriptor per message. The
+# EPMessageType enum above stays as the documented external API.
+EP_METHOD_READY = "ec.ready"
+EP_METHOD_START = "ec.start"
+EP_METHOD_COMPLETE = "ec.complete"
+EP_METHOD_LINE_ITEMS_CHANGE = "ec.line_items.change"
+EP_METHOD_BUYER_CHANGE = "ec.buyer.change"
+EP_METHOD_PAYMENT_CHANGE = "ec.payment.change"
+EP_METHOD_MESSAGES_CHANGE = "ec.messages.change"
+EP_METHOD_FULFILLMENT_CHANGE = "ec.fulfillment.change"
+EP_METHOD_PAYMENT_INSTRUMENTS_CHANGE_REQUEST = "ec.payment.instruments_change_request"
+EP_METHOD_PAYMENT_CREDENTIAL_REQUEST = "ec.payment.credential_request"
+EP_METHOD_FULFILLMENT_ADDRESS_CHANGE_REQUEST = "ec.fulfillment.address_change_request"
+
+# Precompiled validators for inbound result payloads, keyed by the method
+# whose response they validate; TypeAdapter reuses one Rust-side
+# SchemaValidator per model instead of rebuilding per-call state
+_RESULT_ADAPTERS = {
+    EP_METHOD_READY: TypeAdapter(EcReadyResponseResult),
+    EP_METHOD_PAYMENT_INSTRUMENTS_CHANGE_REQUEST: TypeAdapter(EcPaymentInstrumentsChangeResult),
+    EP_METHOD_PAYMENT_CREDENTIAL_REQUEST: TypeAdapter(EcPaymentCredentialResult),
+    EP_METHOD_FULFILLMENT_ADDRESS_CHANGE_REQUEST: TypeAdapter(EcAddressChangeResult),
+}
+
+# Change type -> method string for state change notifications, hoisted so
+# the hottest outbound path doesn't rebuild the map per notification
+_CHANGE_TYPE_MAP = {
+    "line_items": EP_METHOD_LINE_ITEMS_CHANGE,
+    "buyer": EP_METHOD_BUYER_CHANGE,
+    "payment": EP_METHOD_PAYMENT_CHANGE,
+    "fulfillment": EP_METHOD_FULFILLMENT_CHANGE,
+    "messages": EP_METHOD_MESSAGES_CHANGE,
+}
+
+# Pre-serialized skeletons for checkout-carrying notifications: only the
+# checkout payload varies per message, so the constant jsonrpc/method
+# envelope is encoded once and concatenated with the payload. Used when
+# message-history capture is off and the intermediate dict isn't needed.
+def _notification_prefix(method: str) -> str:
+    return '{"jsonrpc":"2.0","method":"' + method + '","params":{"checkout":'
+
+
+_START_PREFIX = _notification_prefix(EP_METHOD_START)
+_COMPLETE_PREFIX = _notification_prefix(EP_METHOD_COMPLETE)
+_CHANGE_PREFIX_MAP = {
+    change_type: _notification_prefix(method)
+    for change_type, method in _CHANGE_TYPE_MAP.items()
+}
+
+
 class EmbeddedCheckoutSession:
     """
     Manages an embedded checkout session.
@@ -195,7 +279,24 @@ class EmbeddedCheckoutSession:
     - Communication channel state
     - Pending requests awaiting responses
     """
-    
+
+    # Slotted: deployments hold one live session per active checkout, so
+    # dropping the per-instance __dict__ is a real memory win
+    __slots__ = (
+        "id",
+        "checkout_id",
+        "ec_version",
+        "ec_auth",
+        "requested_delegations",
+        "accepted_delegations",
+        "is_ready",
+        "is_started",
+        "is_completed",
+        "_pending_requests",
+        "_message_history",
+        "_history_enabled",
+    )
+
     def __init__(
         self,
         checkout_id: str,
@@ -219,7 +320,9 @@ class EmbeddedCheckoutSession:
         
         
         self.requested_delegations = requested_delegations or []
-        self.accepted_delegations: List[str] = []
+        # Set-backed so is_delegation_active is a hash lookup; serialize
+        # via sorted() where a stable list is needed
+        self.accepted_delegations: set = set()
         
        
         self.is_ready = False
@@ -229,8 +332,12 @@ class EmbeddedCheckoutSession:
         # Pending requests (id -> callback)
         self._pending_requests: Dict[str, Any] = {}
         
-        # Message history for debugging
-        self._message_history: List[Dict[str, Any]] = []
+        # Message history for debugging; bounded ring buffer so
+        # long-running sessions don't pin every message ever exchanged.
+        # Only populated when debug logging is on — in production the
+        # append per message is dead memory traffic.
+        self._message_history: deque = deque(maxlen=256)
+        self._history_enabled = logger.isEnabledFor(logging.DEBUG)
     
     def accept_delegation(self, delegation: str) -> bool:
         """
@@ -243,8 +350,7 @@ class EmbeddedCheckoutSession:
             True if delegation was accepted
         """
         if delegation in self.requested_delegations and delegation in SUPPORTED_DELEGATIONS:
-            if delegation not in self.accepted_delegations:
-                self.accepted_delegations.append(delegation)
+            self.accepted_delegations.add(delegation)
             return True
         return False
     
@@ -252,14 +358,16 @@ class EmbeddedCheckoutSession:
         """Accept all requested delegations that are supported."""
         for delegation in self.requested_delegations:
             self.accept_delegation(delegation)
-        return self.accepted_delegations
+        return sorted(self.accepted_delegations)
     
     def is_delegation_active(self, delegation: str) -> bool:
         """Check if a delegation is active."""
         return delegation in self.accepted_delegations
     
     def log_message(self, direction: str, message: Dict[str, Any]) -> None:
-        """Log a message for debugging."""
+        """Log a message for debugging (no-op unless debug logging is on)."""
+        if not self._history_enabled:
+            return
         self._message_history.append({
             "direction": direction,
             "message": message,
@@ -267,102 +375,123 @@ class EmbeddedCheckoutSession:
 
 
 
-class EPMessageFactory:
-    """Factory for creating EP Binding messages."""
-    
-    @staticmethod
-    def create_ready_request(accepted_delegations: List[str]) -> JsonRpcRequest:
-        """Create ec.ready request message."""
-        return JsonRpcRequest(
-            method=EPMessageType.READY.value,
-            params=EcReadyParams(delegate=accepted_delegations).model_dump()
-        )
-    
-    @staticmethod
-    def create_ready_response(
-        request_id: str,
-        upgrade: Optional[Dict[str, Any]] = None,
-        checkout: Optional[Dict[str, Any]] = None,
-    ) -> JsonRpcResponse:
-        """Create ec.ready response message."""
-        result = {}
-        if upgrade:
-            result["upgrade"] = upgrade
-        if checkout:
-            result["checkout"] = checkout
-        return JsonRpcResponse(id=request_id, result=result)
-    
-    @staticmethod
-    def create_start_notification(checkout: Dict[str, Any]) -> JsonRpcNotification:
-        """Create ec.start notification message."""
-        return JsonRpcNotification(
-            method=EPMessageType.START.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_complete_notification(checkout: Dict[str, Any]) -> JsonRpcNotification:
-        """Create ec.complete notification message."""
-        return JsonRpcNotification(
-            method=EPMessageType.COMPLETE.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_state_change_notification(
-        message_type: EPMessageType,
-        checkout: Dict[str, Any]
-    ) -> JsonRpcNotification:
-        """Create a state change notification."""
-        return JsonRpcNotification(
-            method=message_type.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_payment_instruments_change_request(
-        checkout: Dict[str, Any]
-    ) -> JsonRpcRequest:
-        """Create ec.payment.instruments_change_request delegation request."""
-        return JsonRpcRequest(
-            method=EPMessageType.PAYMENT_INSTRUMENTS_CHANGE_REQUEST.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_payment_credential_request(
-        checkout: Dict[str, Any]
-    ) -> JsonRpcRequest:
-        """Create ec.payment.credential_request delegation request."""
-        return JsonRpcRequest(
-            method=EPMessageType.PAYMENT_CREDENTIAL_REQUEST.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_fulfillment_address_change_request(
-        checkout: Dict[str, Any]
-    ) -> JsonRpcRequest:
-        """Create ec.fulfillment.address_change_request delegation request."""
-        return JsonRpcRequest(
-            method=EPMessageType.FULFILLMENT_ADDRESS_CHANGE_REQUEST.value,
-            params=EcCheckoutParams(checkout=checkout).model_dump()
-        )
-    
-    @staticmethod
-    def create_error_response(
-        request_id: str,
-        code: EPErrorCode,
-        message: str,
-        data: Optional[Dict[str, Any]] = None
-    ) -> JsonRpcErrorResponse:
-        """Create an error response."""
-        return JsonRpcErrorResponse(
-            id=request_id,
-            error=JsonRpcErrorData(code=code.value, message=message, data=data)
-        )
+# EP message builders are free functions: the handler previously went
+# through a factory instance holding only staticmethods, paying
+# attribute resolution per call for no state. Messages are plain dicts
+# pre-shaped for serialization (see module docstring); the JsonRpc*
+# models above remain the schema for inbound validation.
 
 
+def create_ready_request(accepted_delegations: List[str]) -> Dict[str, Any]:
+    """Create ec.ready request message."""
+    return {
+        "jsonrpc": "2.0",
+        "id": secrets.token_hex(8),
+        "method": EP_METHOD_READY,
+        "params": {"delegate": accepted_delegations},
+    }
+
+
+def create_ready_response(
+    request_id: str,
+    upgrade: Optional[Dict[str, Any]] = None,
+    checkout: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Create ec.ready response message."""
+    result = {}
+    if upgrade:
+        result["upgrade"] = upgrade
+    if checkout:
+        result["checkout"] = checkout
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def create_start_notification(checkout: Dict[str, Any]) -> Dict[str, Any]:
+    """Create ec.start notification message."""
+    return {
+        "jsonrpc": "2.0",
+        "method": EP_METHOD_START,
+        "params": {"checkout": checkout},
+    }
+
+
+def create_complete_notification(checkout: Dict[str, Any]) -> Dict[str, Any]:
+    """Create ec.complete notification message."""
+    return {
+        "jsonrpc": "2.0",
+        "method": EP_METHOD_COMPLETE,
+        "params": {"checkout": checkout},
+    }
+
+
+def create_state_change_notification(
+    method: str,
+    checkout: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create a state change notification for an EP_METHOD_* method."""
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": {"checkout": checkout},
+    }
+
+
+def create_payment_instruments_change_request(
+    checkout: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create ec.payment.instruments_change_request delegation request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": secrets.token_hex(8),
+        "method": EP_METHOD_PAYMENT_INSTRUMENTS_CHANGE_REQUEST,
+        "params": {"checkout": checkout},
+    }
+
+
+def create_payment_credential_request(
+    checkout: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create ec.payment.credential_request delegation request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": secrets.token_hex(8),
+        "method": EP_METHOD_PAYMENT_CREDENTIAL_REQUEST,
+        "params": {"checkout": checkout},
+    }
+
+
+def create_fulfillment_address_change_request(
+    checkout: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Create ec.fulfillment.address_change_request delegation request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": secrets.token_hex(8),
+        "method": EP_METHOD_FULFILLMENT_ADDRESS_CHANGE_REQUEST,
+        "params": {"checkout": checkout},
+    }
+
+
+# Default error payloads per code, flattened at import so bursts of
+# failures assemble responses from a table instead of building models
+_ERROR_TEMPLATES = {
+    code: {"code": code.value, "message": code.name.replace("_", " ").title()}
+    for code in EPErrorCode
+}
+
+
+def create_error_response(
+    request_id: str,
+    code: EPErrorCode,
+    message: str,
+    data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Create an error response."""
+    error = {**_ERROR_TEMPLATES[code], "data": data}
+    if message:
+        error["message"] = message
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
 
 class EmbeddedCheckoutHandler:
     """
@@ -373,7 +502,9 @@ class EmbeddedCheckoutHandler:
     2. Generate appropriate response messages
     3. Create delegation requests when needed
     """
-    
+
+    __slots__ = ("session",)
+
     def __init__(self, session: EmbeddedCheckoutSession):
         """
         Initialize the handler.
@@ -382,7 +513,6 @@ class EmbeddedCheckoutHandler:
             session: The embedded checkout session
         """
         self.session = session
-        self.factory = EPMessageFactory()
     
     def parse_message(self, raw_message: str) -> Dict[str, Any]:
         """
@@ -397,9 +527,16 @@ class EmbeddedCheckoutHandler:
         Raises:
             ValueError: If message is not valid JSON-RPC 2.0
         """
+        # Cheap prefilters before building a full dict tree: a hostile or
+        # broken host can spam arbitrarily large or non-JSON-RPC payloads,
+        # and a C-level substring scan rejects those without parsing
+        if len(raw_message) > MAX_EP_MESSAGE_BYTES:
+            raise ValueError("EP message exceeds size limit")
+        if '"jsonrpc"' not in raw_message:
+            raise ValueError("Not a valid JSON-RPC 2.0 message")
         try:
-            message = json.loads(raw_message)
-        except json.JSONDecodeError as e:
+            message = _loads(raw_message)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON: {e}")
         
         if message.get("jsonrpc") != "2.0":
@@ -423,8 +560,32 @@ class EmbeddedCheckoutHandler:
         
         logger.info(f"Embedded checkout ready, delegations: {self.session.accepted_delegations}")
         
-        return EcReadyResponseResult.model_validate(result)
+        # The host is trusted and both fields are pass-through dicts, so
+        # skip the validator pipeline and build the model directly
+        return EcReadyResponseResult.model_construct(
+            upgrade=result.get("upgrade"),
+            checkout=result.get("checkout"),
+        )
     
+    def validate_result(self, method: str, result: Dict[str, Any]) -> Any:
+        """
+        Validate a delegation/handshake result payload for a method.
+
+        Args:
+            method: The EP method the result responds to
+            result: The raw result dict
+
+        Returns:
+            The validated result model
+
+        Raises:
+            ValueError: If the method has no result schema
+        """
+        adapter = _RESULT_ADAPTERS.get(method)
+        if adapter is None:
+            raise ValueError(f"No result schema for method: {method}")
+        return adapter.validate_python(result)
+
     def create_ready_request(self) -> str:
         """
         Create the ec.ready request to send to host.
@@ -435,12 +596,31 @@ class EmbeddedCheckoutHandler:
         # Accept all supported delegations that were requested
         self.session.accept_all_supported_delegations()
         
-        request = self.factory.create_ready_request(self.session.accepted_delegations)
-        message = request.model_dump()
+        message = create_ready_request(sorted(self.session.accepted_delegations))
         
         self.session.log_message("sent", message)
-        return json.dumps(message)
+        return _dumps(message)
     
+    def create_start_message(self, checkout: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create ec.start notification as a dict.
+
+        In-process transports (and bridges that re-serialize anyway) can
+        consume this directly; serialization happens at most once, at the
+        real postMessage boundary.
+
+        Args:
+            checkout: Current checkout state
+
+        Returns:
+            The notification message dict
+        """
+        message = create_start_notification(checkout)
+
+        self.session.is_started = True
+        self.session.log_message("sent", message)
+        return message
+
     def create_start_notification(self, checkout: Dict[str, Any]) -> str:
         """
         Create ec.start notification.
@@ -451,13 +631,27 @@ class EmbeddedCheckoutHandler:
         Returns:
             JSON string of the notification
         """
-        notification = self.factory.create_start_notification(checkout)
-        message = notification.model_dump()
-        
-        self.session.is_started = True
+        if not self.session._history_enabled:
+            self.session.is_started = True
+            return _START_PREFIX + _dumps(checkout) + '}}'
+        return _dumps(self.create_start_message(checkout))
+
+    def create_complete_message(self, checkout: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create ec.complete notification as a dict (see create_start_message).
+
+        Args:
+            checkout: Final checkout state with order
+
+        Returns:
+            The notification message dict
+        """
+        message = create_complete_notification(checkout)
+
+        self.session.is_completed = True
         self.session.log_message("sent", message)
-        return json.dumps(message)
-    
+        return message
+
     def create_complete_notification(self, checkout: Dict[str, Any]) -> str:
         """
         Create ec.complete notification.
@@ -468,13 +662,35 @@ class EmbeddedCheckoutHandler:
         Returns:
             JSON string of the notification
         """
-        notification = self.factory.create_complete_notification(checkout)
-        message = notification.model_dump()
-        
-        self.session.is_completed = True
+        if not self.session._history_enabled:
+            self.session.is_completed = True
+            return _COMPLETE_PREFIX + _dumps(checkout) + '}}'
+        return _dumps(self.create_complete_message(checkout))
+
+    def create_state_change_message(
+        self,
+        change_type: str,
+        checkout: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Create a state change notification as a dict (see create_start_message).
+
+        Args:
+            change_type: Type of change (line_items, buyer, payment, fulfillment)
+            checkout: Current checkout state
+
+        Returns:
+            The notification message dict
+        """
+        message_type = _CHANGE_TYPE_MAP.get(change_type)
+        if not message_type:
+            raise ValueError(f"Unknown change type: {change_type}")
+
+        message = create_state_change_notification(message_type, checkout)
+
         self.session.log_message("sent", message)
-        return json.dumps(message)
-    
+        return message
+
     def create_state_change_notification(
         self,
         change_type: str,
@@ -490,24 +706,12 @@ class EmbeddedCheckoutHandler:
         Returns:
             JSON string of the notification
         """
-        # Map change type to message type
-        type_map = {
-            "line_items": EPMessageType.LINE_ITEMS_CHANGE,
-            "buyer": EPMessageType.BUYER_CHANGE,
-            "payment": EPMessageType.PAYMENT_CHANGE,
-            "fulfillment": EPMessageType.FULFILLMENT_CHANGE,
-            "messages": EPMessageType.MESSAGES_CHANGE,
-        }
-        
-        message_type = type_map.get(change_type)
-        if not message_type:
-            raise ValueError(f"Unknown change type: {change_type}")
-        
-        notification = self.factory.create_state_change_notification(message_type, checkout)
-        message = notification.model_dump()
-        
-        self.session.log_message("sent", message)
-        return json.dumps(message)
+        if not self.session._history_enabled:
+            prefix = _CHANGE_PREFIX_MAP.get(change_type)
+            if prefix is None:
+                raise ValueError(f"Unknown change type: {change_type}")
+            return prefix + _dumps(checkout) + '}}'
+        return _dumps(self.create_state_change_message(change_type, checkout))
     
     def create_payment_credential_request(self, checkout: Dict[str, Any]) -> Optional[str]:
         """
@@ -522,11 +726,10 @@ class EmbeddedCheckoutHandler:
         if not self.session.is_delegation_active(EP_DELEGATE_PAYMENT_CREDENTIAL):
             return None
         
-        request = self.factory.create_payment_credential_request(checkout)
-        message = request.model_dump()
+        message = create_payment_credential_request(checkout)
         
         self.session.log_message("sent", message)
-        return json.dumps(message)
+        return _dumps(message)
     
     def create_address_change_request(self, checkout: Dict[str, Any]) -> Optional[str]:
         """
@@ -541,11 +744,10 @@ class EmbeddedCheckoutHandler:
         if not self.session.is_delegation_active(EP_DELEGATE_FULFILLMENT_ADDRESS):
             return None
         
-        request = self.factory.create_fulfillment_address_change_request(checkout)
-        message = request.model_dump()
+        message = create_fulfillment_address_change_request(checkout)
         
         self.session.log_message("sent", message)
-        return json.dumps(message)
+        return _dumps(message)
 
 
 # ============================================================================
@@ -575,13 +777,13 @@ def parse_ep_query_params(
         raise ValueError("ec_version parameter is required")
     
     # Parse version (format: YYYY-MM-DD)
-    if not ec_version.count("-") == 2:
+    if not _EC_VERSION_RE.match(ec_version):
         raise ValueError("ec_version must be in YYYY-MM-DD format")
     
-    # Parse delegations
-    delegations = []
+    # Parse delegations: strip each token once, dedupe, freeze
+    delegations = ()
     if ec_delegate:
-        delegations = [d.strip() for d in ec_delegate.split(",") if d.strip()]
+        delegations = tuple({s for s in (d.strip() for d in ec_delegate.split(",")) if s})
     
     return {
         "version": ec_version,
@@ -19,11 +19,26 @@ Provides HTTP endpoints for serving the embedded checkout UI and handling
 checkout-related actions.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from typing import Optional
+import functools
+import gzip
+import hashlib
 import logging
 import os
+import re
+
+import jinja2
+import orjson
+from cachetools import TTLCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
 
 from .embedded_checkout import (
     create_embedded_checkout_session,
@@ -34,322 +49,165 @@ from .store import RetailStore
 
 logger = logging.getLogger(__name__)
 
-# Create router
-router = APIRouter(prefix="/embedded-checkout", tags=["Embedded Checkout"])
+# Create router. ORJSONResponse serializes straight from dicts with
+# orjson, skipping the jsonable_encoder walk per response.
+router = APIRouter(
+    prefix="/embedded-checkout",
+    tags=["Embedded Checkout"],
+    default_response_class=ORJSONResponse,
+)
 
-# Store instance (shared with MCP server)
+# Store instance (shared with MCP server). get_checkout is a single
+# in-process dict probe returning the live object, so no read cache
+# fronts it — the expensive derived artifact (the rendered page) is
+# what gets cached below.
 store = RetailStore()
 
+# Tokenizes "a, b ,c" in one C-level scan; commas and surrounding
+# whitespace never survive a match
+_DELEG_RE = re.compile(r"[^\s,]+")
 
-def get_checkout_html_template() -> str:
-    """Read the embedded checkout HTML template."""
-    template_path = os.path.join(
-        os.path.dirname(__file__),
-        "templates",
-        "embedded_checkout.html"
+# Pre-serialized miss body for the GET route: scanner/bot traffic hits
+# unknown ids constantly, and this skips exception construction, the
+# exception handler, and the JSON encode. Deliberately omits the id.
+_NOT_FOUND_BODY = b'{"detail":"Checkout not found"}'
+
+
+async def _read_json(request: Request) -> dict:
+    """Decode the request body with orjson instead of stdlib json.
+
+    request.json() routes through json.loads; orjson decodes the same
+    bytes in C and rejects malformed input with the same ValueError
+    family (JSONDecodeError subclasses it).
+    """
+    return orjson.loads(await request.body())
+
+
+def _success_body(checkout) -> bytes:
+    """Serialize a checkout into the success envelope without a dict round-trip.
+
+    model_dump_json serializes the model in one Rust pass; concatenating
+    the envelope avoids re-walking that output as Python objects.
+    """
+    return b'{"status":"success","checkout":' + checkout.model_dump_json().encode() + b"}"
+
+
+def _success_response(checkout) -> Response:
+    return Response(content=_success_body(checkout), media_type="application/json")
+
+
+# Resolved once; the template location never moves at runtime
+_TEMPLATE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "templates",
+    "embedded_checkout.html"
+)
+_TEMPLATE_EXISTS = os.path.isfile(_TEMPLATE_PATH)
+
+_STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+
+def _asset(name: str) -> str:
+    """Prefer the minified build of a static asset when it exists."""
+    base, _, ext = name.rpartition(".")
+    minified = f"{base}.min.{ext}"
+    if os.path.exists(os.path.join(_STATIC_DIR, minified)):
+        return minified
+    return name
+
+
+# Chosen once at import; run scripts/build_static.py to produce the
+# minified variants
+_CSS_ASSET = _asset("embedded_checkout.css")
+_JS_ASSET = _asset("embedded_checkout.js")
+
+
+# Rendered page bytes keyed by checkout snapshot, stored as
+# (plain, gzip, brotli-or-None). A hit skips the render, the boot
+# model_dump, and the compression; the short TTL is safe because state
+# changes flow over the JSON-RPC channel, not an HTML reload.
+_HTML_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+# Completed-order responses keyed by (checkout_id, idempotency_key):
+# client retries replay the stored bytes instead of re-entering
+# start_payment/place_order (place_order deletes the checkout, so a
+# retry would otherwise 404 instead of confirming the order)
+_IDEMPOTENCY: TTLCache = TTLCache(maxsize=10_000, ttl=600)
+
+
+def _cache_entry(body: bytes) -> tuple:
+    """Compress a rendered page once per cache window.
+
+    The HTML compresses ~5x; paying the compression on the cache miss
+    beats GZipMiddleware recompressing every response. Brotli quality 5
+    keeps the miss path cheap while still beating gzip on size.
+    """
+    return (
+        body,
+        gzip.compress(body, compresslevel=9),
+        brotli.compress(body, quality=5) if brotli is not None else None,
     )
-    
-    if os.path.exists(template_path):
-        with open(template_path, "r", encoding="utf-8") as f:
+
+
+@functools.lru_cache(maxsize=1)
+def get_checkout_html_template() -> str:
+    """Read the embedded checkout HTML template.
+
+    Cached after the first call: the GET route is hot and re-reading the
+    template costs a stat plus a full disk read per request.
+    """
+    if _TEMPLATE_EXISTS:
+        with open(_TEMPLATE_PATH, "r", encoding="utf-8") as f:
             return f.read()
-    
+
     # Fallback to inline template if file doesn't exist
     return get_inline_checkout_template()
 
 
+def reload_templates() -> None:
+    """Drop the cached templates (dev convenience after edits on disk)."""
+    get_checkout_html_template.cache_clear()
+    get_inline_checkout_template.cache_clear()
+    _compiled_template.cache_clear()
+    _shell_parts.cache_clear()
+    _HTML_CACHE.clear()
+
+
+# auto_reload=False skips the per-render mtime stat; the template source
+# is fixed for the process lifetime (reload_templates() for dev)
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.BaseLoader(),
+    autoescape=True,
+    auto_reload=False,
+)
+# tojson serializes the checkout payload through orjson instead of
+# stdlib json.dumps; Jinja still applies its own HTML-safe escaping on
+# top of the returned string
+_JINJA_ENV.policies["json.dumps_function"] = lambda obj, **_: orjson.dumps(obj).decode()
+_JINJA_ENV.policies["json.dumps_kwargs"] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_template() -> jinja2.Template:
+    """Compile the checkout template once; rendering reuses the bytecode."""
+    return _JINJA_ENV.from_string(get_checkout_html_template())
+
+
+@functools.lru_cache(maxsize=1)
 def get_inline_checkout_template() -> str:
-    """Return inline HTML template for embedded checkout."""
+    """Return the inline HTML shell for embedded checkout.
+
+    The bulky CSS/JS lives in backend/static and is served via the
+    /ec-static mount with long-lived cache headers; only the small boot
+    JSON island varies per request.
+    """
     return '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Checkout - {{ merchant_name }}</title>
-    <style>
-        :root {
-            --primary-color: #6366f1;
-            --primary-hover: #4f46e5;
-            --bg-color: #f8fafc;
-            --card-bg: #ffffff;
-            --text-primary: #1e293b;
-            --text-secondary: #64748b;
-            --border-color: #e2e8f0;
-            --success-color: #10b981;
-            --error-color: #ef4444;
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: var(--bg-color);
-            color: var(--text-primary);
-            line-height: 1.6;
-            padding: 20px;
-        }
-        
-        .checkout-container {
-            max-width: 600px;
-            margin: 0 auto;
-        }
-        
-        .checkout-header {
-            text-align: center;
-            margin-bottom: 24px;
-        }
-        
-        .checkout-header h1 {
-            font-size: 24px;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-        
-        .checkout-status {
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 500;
-            text-transform: uppercase;
-            margin-top: 8px;
-        }
-        
-        .status-incomplete { background: #fef3c7; color: #92400e; }
-        .status-ready { background: #d1fae5; color: #065f46; }
-        .status-completed { background: #dbeafe; color: #1e40af; }
-        .status-canceled { background: #fee2e2; color: #991b1b; }
-        
-        .card {
-            background: var(--card-bg);
-            border-radius: 12px;
-            border: 1px solid var(--border-color);
-            padding: 20px;
-            margin-bottom: 16px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-        }
-        
-        .card-title {
-            font-size: 14px;
-            font-weight: 600;
-            color: var(--text-secondary);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            margin-bottom: 16px;
-        }
-        
-        .line-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid var(--border-color);
-        }
-        
-        .line-item:last-child { border-bottom: none; }
-        
-        .item-info {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-        
-        .item-image {
-            width: 60px;
-            height: 60px;
-            border-radius: 8px;
-            object-fit: cover;
-            background: var(--bg-color);
-        }
-        
-        .item-details h3 {
-            font-size: 14px;
-            font-weight: 500;
-            margin-bottom: 4px;
-        }
-        
-        .item-details .quantity {
-            font-size: 13px;
-            color: var(--text-secondary);
-        }
-        
-        .item-price {
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-        
-        .totals {
-            margin-top: 16px;
-            padding-top: 16px;
-            border-top: 1px solid var(--border-color);
-        }
-        
-        .total-row {
-            display: flex;
-            justify-content: space-between;
-            padding: 6px 0;
-            font-size: 14px;
-        }
-        
-        .total-row.final {
-            font-size: 18px;
-            font-weight: 600;
-            padding-top: 12px;
-            margin-top: 8px;
-            border-top: 2px solid var(--border-color);
-        }
-        
-        .form-group {
-            margin-bottom: 16px;
-        }
-        
-        .form-group label {
-            display: block;
-            font-size: 13px;
-            font-weight: 500;
-            color: var(--text-secondary);
-            margin-bottom: 6px;
-        }
-        
-        .form-group input {
-            width: 100%;
-            padding: 12px;
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            font-size: 14px;
-            transition: border-color 0.2s;
-        }
-        
-        .form-group input:focus {
-            outline: none;
-            border-color: var(--primary-color);
-        }
-        
-        .form-row {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 12px;
-        }
-        
-        .btn {
-            display: block;
-            width: 100%;
-            padding: 14px 24px;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .btn-primary {
-            background: var(--primary-color);
-            color: white;
-        }
-        
-        .btn-primary:hover {
-            background: var(--primary-hover);
-        }
-        
-        .btn-primary:disabled {
-            background: var(--text-secondary);
-            cursor: not-allowed;
-        }
-        
-        .btn-secondary {
-            background: transparent;
-            color: var(--text-secondary);
-            border: 1px solid var(--border-color);
-            margin-top: 12px;
-        }
-        
-        .btn-secondary:hover {
-            background: var(--bg-color);
-        }
-        
-        .messages {
-            margin-bottom: 16px;
-        }
-        
-        .message {
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-            margin-bottom: 8px;
-        }
-        
-        .message-error {
-            background: #fef2f2;
-            color: var(--error-color);
-            border: 1px solid #fecaca;
-        }
-        
-        .message-info {
-            background: #eff6ff;
-            color: #1d4ed8;
-            border: 1px solid #bfdbfe;
-        }
-        
-        .success-container {
-            text-align: center;
-            padding: 40px 20px;
-        }
-        
-        .success-icon {
-            width: 64px;
-            height: 64px;
-            background: var(--success-color);
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0 auto 20px;
-        }
-        
-        .success-icon svg {
-            width: 32px;
-            height: 32px;
-            color: white;
-        }
-        
-        .order-id {
-            font-family: monospace;
-            background: var(--bg-color);
-            padding: 8px 16px;
-            border-radius: 4px;
-            margin-top: 12px;
-            display: inline-block;
-        }
-        
-        #debug-panel {
-            position: fixed;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            background: #1e293b;
-            color: #e2e8f0;
-            max-height: 200px;
-            overflow-y: auto;
-            font-family: monospace;
-            font-size: 11px;
-            padding: 8px;
-            display: none;
-        }
-        
-        #debug-panel.active { display: block; }
-        
-        .debug-message {
-            padding: 4px 0;
-            border-bottom: 1px solid #334155;
-        }
-        
-        .debug-sent { color: #a78bfa; }
-        .debug-received { color: #34d399; }
-    </style>
+    <link rel="stylesheet" href="/ec-static/{{ css_asset }}">
 </head>
 <body>
     <div class="checkout-container" id="checkout-app">
@@ -358,529 +216,63 @@ def get_inline_checkout_template() -> str:
             <h1>Loading checkout...</h1>
         </div>
     </div>
-    
+
     <div id="debug-panel"></div>
-    
-    <script>
-    // ========================================================================
-    // Embedded Checkout Protocol Client
-    // ========================================================================
-    
-    const EmbeddedCheckout = {
-        // Configuration
-        config: {
-            checkoutId: '{{ checkout_id }}',
-            version: '{{ ec_version }}',
-            delegations: {{ delegations | tojson }},
-            debug: true,
-        },
-        
-        // State
-        state: {
-            checkout: {{ checkout | tojson }},
-            isReady: false,
-            isCompleted: false,
-            messagePort: null,
-            pendingRequests: {},
-        },
-        
-        // Initialize the embedded checkout
-        init() {
-            this.log('Initializing Embedded Checkout Protocol');
-            this.setupCommunication();
-            this.render();
-            this.sendReady();
-        },
-        
-        // Set up communication channels
-        setupCommunication() {
-            // For native hosts
-            window.EmbeddedCheckoutProtocol = {
-                postMessage: (message) => this.handleMessage(message)
-            };
-            
-            // For web hosts via postMessage
-            window.addEventListener('message', (event) => {
-                // Validate origin in production
-                this.handleMessage(event.data);
-            });
-        },
-        
-        // Send message to host
-        sendToHost(message) {
-            const jsonMessage = typeof message === 'string' ? message : JSON.stringify(message);
-            this.debugLog('sent', JSON.parse(jsonMessage));
-            
-            // Use MessagePort if available (upgraded channel)
-            if (this.state.messagePort) {
-                this.state.messagePort.postMessage(jsonMessage);
-                return;
-            }
-            
-            // For native hosts
-            if (window.EmbeddedCheckoutProtocolConsumer) {
-                window.EmbeddedCheckoutProtocolConsumer.postMessage(jsonMessage);
-                return;
-            }
-            
-            // WebKit message handler for iOS
-            if (window.webkit?.messageHandlers?.EmbeddedCheckoutProtocolConsumer) {
-                window.webkit.messageHandlers.EmbeddedCheckoutProtocolConsumer.postMessage(jsonMessage);
-                return;
-            }
-            
-            // For web hosts
-            if (window.parent !== window) {
-                window.parent.postMessage(jsonMessage, '*');
-            }
-        },
-        
-        // Handle incoming message
-        handleMessage(data) {
-            try {
-                const message = typeof data === 'string' ? JSON.parse(data) : data;
-                this.debugLog('received', message);
-                
-                // Handle response to our request
-                if (message.id && this.state.pendingRequests[message.id]) {
-                    const { resolve, reject } = this.state.pendingRequests[message.id];
-                    delete this.state.pendingRequests[message.id];
-                    
-                    if (message.error) {
-                        reject(message.error);
-                    } else {
-                        resolve(message.result || {});
-                    }
-                    return;
-                }
-                
-                // Handle ec.ready response (special case - it's a response to our request)
-                if (message.result !== undefined && !this.state.isReady) {
-                    this.handleReadyResponse(message);
-                    return;
-                }
-            } catch (e) {
-                this.log('Error handling message:', e);
-            }
-        },
-        
-        // Send ec.ready request
-        sendReady() {
-            const request = {
-                jsonrpc: '2.0',
-                id: this.generateId(),
-                method: 'ec.ready',
-                params: {
-                    delegate: this.config.delegations
-                }
-            };
-            
-            this.state.pendingRequests[request.id] = {
-                resolve: (result) => this.handleReadyResponse({ id: request.id, result }),
-                reject: (error) => this.log('ec.ready rejected:', error)
-            };
-            
-            this.sendToHost(request);
-        },
-        
-        // Handle ec.ready response
-        handleReadyResponse(response) {
-            this.state.isReady = true;
-            const result = response.result || {};
-            
-            // Handle channel upgrade
-            if (result.upgrade?.port) {
-                this.state.messagePort = result.upgrade.port;
-                this.log('Communication channel upgraded');
-                // Re-send ec.ready on upgraded channel
-                this.sendReady();
-                return;
-            }
-            
-            // Handle checkout state from host
-            if (result.checkout) {
-                if (result.checkout.payment?.instruments) {
-                    this.state.checkout.payment = {
-                        ...this.state.checkout.payment,
-                        ...result.checkout.payment
-                    };
-                }
-            }
-            
-            this.log('Handshake complete, sending ec.start');
-            this.sendStart();
-        },
-        
-        // Send ec.start notification
-        sendStart() {
-            this.sendToHost({
-                jsonrpc: '2.0',
-                method: 'ec.start',
-                params: {
-                    checkout: this.state.checkout
-                }
-            });
-        },
-        
-        // Send ec.complete notification
-        sendComplete() {
-            this.state.isCompleted = true;
-            this.sendToHost({
-                jsonrpc: '2.0',
-                method: 'ec.complete',
-                params: {
-                    checkout: this.state.checkout
-                }
-            });
-        },
-        
-        // Send state change notification
-        sendStateChange(changeType) {
-            this.sendToHost({
-                jsonrpc: '2.0',
-                method: `ec.${changeType}.change`,
-                params: {
-                    checkout: this.state.checkout
-                }
-            });
-        },
-        
-        // Request payment credential (delegation)
-        async requestPaymentCredential() {
-            if (!this.config.delegations.includes('payment.credential')) {
-                return null;
-            }
-            
-            const request = {
-                jsonrpc: '2.0',
-                id: this.generateId(),
-                method: 'ec.payment.credential_request',
-                params: {
-                    checkout: this.state.checkout
-                }
-            };
-            
-            return new Promise((resolve, reject) => {
-                this.state.pendingRequests[request.id] = { resolve, reject };
-                this.sendToHost(request);
-                
-                // Timeout after 5 minutes
-                setTimeout(() => {
-                    if (this.state.pendingRequests[request.id]) {
-                        delete this.state.pendingRequests[request.id];
-                        reject({ code: -32001, message: 'Request timeout' });
-                    }
-                }, 300000);
-            });
-        },
-        
-        // Request address change (delegation)
-        async requestAddressChange() {
-            if (!this.config.delegations.includes('fulfillment.address_change')) {
-                return null;
-            }
-            
-            const request = {
-                jsonrpc: '2.0',
-                id: this.generateId(),
-                method: 'ec.fulfillment.address_change_request',
-                params: {
-                    checkout: this.state.checkout
-                }
-            };
-            
-            return new Promise((resolve, reject) => {
-                this.state.pendingRequests[request.id] = { resolve, reject };
-                this.sendToHost(request);
-                
-                setTimeout(() => {
-                    if (this.state.pendingRequests[request.id]) {
-                        delete this.state.pendingRequests[request.id];
-                        reject({ code: -32001, message: 'Request timeout' });
-                    }
-                }, 300000);
-            });
-        },
-        
-        // Generate unique ID
-        generateId() {
-            return 'req_' + Math.random().toString(36).substr(2, 9);
-        },
-        
-        // Logging
-        log(...args) {
-            console.log('[EC]', ...args);
-        },
-        
-        debugLog(direction, message) {
-            if (!this.config.debug) return;
-            
-            const panel = document.getElementById('debug-panel');
-            panel.classList.add('active');
-            
-            const div = document.createElement('div');
-            div.className = `debug-message debug-${direction}`;
-            div.textContent = `[${direction.toUpperCase()}] ${JSON.stringify(message)}`;
-            panel.insertBefore(div, panel.firstChild);
-            
-            // Keep only last 50 messages
-            while (panel.children.length > 50) {
-                panel.removeChild(panel.lastChild);
-            }
-        },
-        
-        // Format currency
-        formatCurrency(amount) {
-            return new Intl.NumberFormat('en-US', {
-                style: 'currency',
-                currency: this.state.checkout.currency || 'USD'
-            }).format(amount / 100);
-        },
-        
-        // Render the checkout UI
-        render() {
-            const app = document.getElementById('checkout-app');
-            const checkout = this.state.checkout;
-            
-            if (checkout.status === 'completed') {
-                this.renderCompleted(app, checkout);
-                return;
-            }
-            
-            app.innerHTML = `
-                <div class="checkout-header">
-                    <h1>Checkout</h1>
-                    <span class="checkout-status status-${checkout.status}">
-                        ${checkout.status?.replace(/_/g, ' ') || 'incomplete'}
-                    </span>
-                </div>
-                
-                ${this.renderMessages(checkout)}
-                ${this.renderLineItems(checkout)}
-                ${this.renderBuyerForm(checkout)}
-                ${this.renderTotals(checkout)}
-                ${this.renderActions(checkout)}
-            `;
-            
-            this.attachEventListeners();
-        },
-        
-        renderMessages(checkout) {
-            if (!checkout.messages?.length) return '';
-            
-            return `
-                <div class="messages">
-                    ${checkout.messages.map(msg => `
-                        <div class="message message-${msg.type || 'error'}">
-                            ${msg.content || msg.message}
-                        </div>
-                    `).join('')}
-                </div>
-            `;
-        },
-        
-        renderLineItems(checkout) {
-            if (!checkout.line_items?.length) return '';
-            
-            return `
-                <div class="card">
-                    <div class="card-title">Order Summary</div>
-                    ${checkout.line_items.map(item => `
-                        <div class="line-item">
-                            <div class="item-info">
-                                ${item.item.image_url ? 
-                                    `<img src="${item.item.image_url}" alt="${item.item.title}" class="item-image">` : 
-                                    '<div class="item-image"></div>'
-                                }
-                                <div class="item-details">
-                                    <h3>${item.item.title}</h3>
-                                    <span class="quantity">Qty: ${item.quantity}</span>
-                                </div>
-                            </div>
-                            <span class="item-price">
-                                ${this.formatCurrency(item.item.price * item.quantity)}
-                            </span>
-                        </div>
-                    `).join('')}
-                </div>
-            `;
-        },
-        
-        renderBuyerForm(checkout) {
-            const buyer = checkout.buyer || {};
-            
-            return `
-                <div class="card">
-                    <div class="card-title">Contact Information</div>
-                    <div class="form-group">
-                        <label for="email">Email</label>
-                        <input type="email" id="email" name="email" 
-                               value="${buyer.email || ''}" 
-                               placeholder="your@email.com">
-                    </div>
-                    <div class="form-row">
-                        <div class="form-group">
-                            <label for="firstName">First Name</label>
-                            <input type="text" id="firstName" name="firstName" 
-                                   value="${buyer.first_name || ''}" 
-                                   placeholder="John">
-                        </div>
-                        <div class="form-group">
-                            <label for="lastName">Last Name</label>
-                            <input type="text" id="lastName" name="lastName" 
-                                   value="${buyer.last_name || ''}" 
-                                   placeholder="Doe">
-                        </div>
-                    </div>
-                </div>
-            `;
-        },
-        
-        renderTotals(checkout) {
-            if (!checkout.totals?.length) return '';
-            
-            return `
-                <div class="card">
-                    <div class="card-title">Order Total</div>
-                    <div class="totals">
-                        ${checkout.totals.map(total => `
-                            <div class="total-row ${total.type === 'total' ? 'final' : ''}">
-                                <span>${total.display_text}</span>
-                                <span>${this.formatCurrency(total.amount)}</span>
-                            </div>
-                        `).join('')}
-                    </div>
-                </div>
-            `;
-        },
-        
-        renderActions(checkout) {
-            const canComplete = checkout.status === 'ready_for_complete';
-            
-            return `
-                <button id="completeBtn" class="btn btn-primary" ${canComplete ? '' : 'disabled'}>
-                    ${canComplete ? 'Complete Order' : 'Fill Required Information'}
-                </button>
-                <button id="updateBtn" class="btn btn-secondary">
-                    Update Information
-                </button>
-            `;
-        },
-        
-        renderCompleted(app, checkout) {
-            app.innerHTML = `
-                <div class="card success-container">
-                    <div class="success-icon">
-                        <svg fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
-                        </svg>
-                    </div>
-                    <h2>Order Confirmed!</h2>
-                    <p>Thank you for your purchase</p>
-                    ${checkout.order?.id ? `
-                        <div class="order-id">Order ID: ${checkout.order.id}</div>
-                    ` : ''}
-                    ${checkout.order?.permalink_url ? `
-                        <a href="${checkout.order.permalink_url}" class="btn btn-primary" style="margin-top: 20px; display: inline-block; width: auto;">
-                            View Order Details
-                        </a>
-                    ` : ''}
-                </div>
-            `;
-            
-            this.sendComplete();
-        },
-        
-        attachEventListeners() {
-            // Update button
-            document.getElementById('updateBtn')?.addEventListener('click', () => {
-                this.updateBuyerInfo();
-            });
-            
-            // Complete button
-            document.getElementById('completeBtn')?.addEventListener('click', () => {
-                this.completeCheckout();
-            });
-        },
-        
-        async updateBuyerInfo() {
-            const email = document.getElementById('email')?.value;
-            const firstName = document.getElementById('firstName')?.value;
-            const lastName = document.getElementById('lastName')?.value;
-            
-            try {
-                const response = await fetch(`/embedded-checkout/${this.config.checkoutId}/update`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        buyer: {
-                            email,
-                            first_name: firstName,
-                            last_name: lastName
-                        }
-                    })
-                });
-                
-                if (response.ok) {
-                    const data = await response.json();
-                    this.state.checkout = data.checkout;
-                    this.render();
-                    this.sendStateChange('buyer');
-                }
-            } catch (e) {
-                this.log('Error updating buyer info:', e);
-            }
-        },
-        
-        async completeCheckout() {
-            try {
-                // Request payment credential if delegated
-                if (this.config.delegations.includes('payment.credential')) {
-                    try {
-                        const credential = await this.requestPaymentCredential();
-                        if (credential?.credential) {
-                            // Handle payment credential
-                            this.log('Received payment credential');
-                        }
-                    } catch (e) {
-                        if (e.code === -32001) {
-                            this.log('User cancelled payment');
-                            return;
-                        }
-                    }
-                }
-                
-                const response = await fetch(`/embedded-checkout/${this.config.checkoutId}/complete`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        idempotency_key: this.generateId()
-                    })
-                });
-                
-                if (response.ok) {
-                    const data = await response.json();
-                    this.state.checkout = data.checkout;
-                    this.render();
-                }
-            } catch (e) {
-                this.log('Error completing checkout:', e);
-            }
-        }
-    };
-    
-    // Initialize on DOM ready
-    document.addEventListener('DOMContentLoaded', () => {
-        EmbeddedCheckout.init();
-    });
-    </script>
+
+    <script>window.__EC_BOOT__ = {{ boot | tojson }};</script>
+    <script src="/ec-static/{{ js_asset }}" defer></script>
 </body>
 </html>'''
 
 
+@functools.lru_cache(maxsize=1)
+def _shell_parts() -> Optional[tuple]:
+    """Pre-split the rendered shell around the boot JSON island.
+
+    Only ``boot`` varies per request — merchant name and asset names are
+    fixed at import — so the page reduces to ``prefix + boot_json +
+    suffix``, cheaper than even a string.Template substitution pass.
+    Returns None when the template on disk doesn't reduce to a single
+    boot placeholder; callers then fall back to a full Jinja render.
+    """
+    sentinel = "f7c1e5a9d3b84e02"
+    html = _compiled_template().render(
+        boot=sentinel,
+        merchant_name="UCP Store",
+        css_asset=_CSS_ASSET,
+        js_asset=_JS_ASSET,
+    )
+    parts = html.split(f'"{sentinel}"')
+    if len(parts) != 2:
+        return None
+    return parts[0].encode("utf-8"), parts[1].encode("utf-8")
+
+
+def _script_safe_json(obj) -> bytes:
+    """Serialize to JSON bytes safe to embed inside a <script> tag.
+
+    Mirrors the escaping Jinja's tojson filter applies so a payload
+    containing "</script>" cannot break out of the boot island.
+    """
+    return (
+        orjson.dumps(obj)
+        .replace(b"&", b"\\u0026")
+        .replace(b"<", b"\\u003c")
+        .replace(b">", b"\\u003e")
+        .replace(b"'", b"\\u0027")
+    )
+
+
+# Prime the template at import — earlier than any lifespan hook would
+# run, so the read/compile/split cost never lands on a request and the
+# first request after a cold start pays nothing extra
+_shell_parts()
+
+
 @router.get("/{checkout_id}", response_class=HTMLResponse)
 async def get_embedded_checkout(
     checkout_id: str,
+    request: Request,
     ec_version: str = Query(..., description="UCP version (format: YYYY-MM-DD)"),
     ec_delegate: Optional[str] = Query(None, description="Comma-separated delegation identifiers"),
     ec_auth: Optional[str] = Query(None, description="Authentication token"),
@@ -893,19 +285,23 @@ async def get_embedded_checkout(
     """
     # Get checkout from store
     checkout = store.get_checkout(checkout_id)
-    
+
     if checkout is None:
-        raise HTTPException(
+        return Response(
+            content=_NOT_FOUND_BODY,
             status_code=404,
-            detail=f"Checkout with ID {checkout_id} not found"
+            media_type="application/json",
         )
-    
-    # Parse delegations
-    delegations = []
-    if ec_delegate:
-        delegations = [d.strip() for d in ec_delegate.split(",") if d.strip()]
-        # Filter to only supported delegations
-        delegations = [d for d in delegations if d in SUPPORTED_DELEGATIONS]
+
+    # Tokenize and filter in one scan; SUPPORTED_DELEGATIONS is a
+    # frozenset so each membership check is a hashed O(1) lookup, and the
+    # comprehension keeps the host's requested order (set.intersection
+    # would not)
+    delegations = (
+        [d for d in _DELEG_RE.findall(ec_delegate) if d in SUPPORTED_DELEGATIONS]
+        if ec_delegate
+        else []
+    )
     
     # Create session (for tracking)
     try:
@@ -918,22 +314,72 @@ async def get_embedded_checkout(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
-    logger.info(f"Serving embedded checkout for {checkout_id}, delegations: {delegations}")
-    
-    # Get and render template
-    template = get_inline_checkout_template()
-    
-    # Simple template replacement (in production, use Jinja2)
-    import json as json_module
-    checkout_json = checkout.model_dump(mode="json")
-    
-    html = template.replace("{{ checkout_id }}", checkout_id)
-    html = html.replace("{{ ec_version }}", ec_version)
-    html = html.replace("{{ delegations | tojson }}", json_module.dumps(delegations))
-    html = html.replace("{{ checkout | tojson }}", json_module.dumps(checkout_json))
-    html = html.replace("{{ merchant_name }}", "UCP Store")
-    
-    return HTMLResponse(content=html)
+    # One lazily-formatted record per request: the %-args are only
+    # stringified if a handler at INFO is attached
+    logger.info("ec.get checkout_id=%s delegations=%d", checkout_id, len(delegations))
+
+    # The page embeds the full serialized checkout, so the cache key
+    # carries a digest of that serialization: any mutation — buyer
+    # edits, line-item changes, recalculated totals — changes the
+    # digest even when the status doesn't move, invalidating both the
+    # cache entry and client If-None-Match state. The model has no
+    # updated_at/revision field to key on instead.
+    checkout_json = checkout.model_dump_json()
+    checkout_digest = hashlib.blake2b(
+        checkout_json.encode(), digest_size=16
+    ).hexdigest()
+    cache_key = (checkout_id, checkout_digest, ec_version, tuple(delegations))
+
+    # The page is a pure function of the cache key, so it doubles as an
+    # ETag: an iframe reload with a matching If-None-Match skips the
+    # render and the body bytes entirely
+    etag = '"%s"' % hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+
+    entry = _HTML_CACHE.get(cache_key)
+    if entry is None:
+        boot = {
+            "checkout_id": checkout_id,
+            "ec_version": ec_version,
+            "delegations": delegations,
+            # Reuses the serialization already produced for the digest
+            "checkout": orjson.loads(checkout_json),
+        }
+        parts = _shell_parts()
+        if parts is not None:
+            # Specialized path: concatenate the pre-rendered shell around
+            # the boot JSON — no Jinja VM, no per-request UTF-8 encode.
+            # A single join beats streaming head/JSON/tail chunks here:
+            # it keeps Content-Length, the precompressed variants, and
+            # the 304 path, and the JSON serialization it would overlap
+            # is microseconds
+            body = b"".join((parts[0], _script_safe_json(boot), parts[1]))
+        else:
+            # Custom template on disk; full Jinja render
+            html = _compiled_template().render(
+                boot=boot,
+                merchant_name="UCP Store",
+                css_asset=_CSS_ASSET,
+                js_asset=_JS_ASSET,
+            )
+            body = html.encode("utf-8")
+        entry = _cache_entry(body)
+        _HTML_CACHE[cache_key] = entry
+
+    # Serve the precompressed variant the client accepts
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if entry[2] is not None and "br" in accept_encoding:
+        return HTMLResponse(
+            content=entry[2],
+            headers={"content-encoding": "br", "vary": "Accept-Encoding", "etag": etag},
+        )
+    if "gzip" in accept_encoding:
+        return HTMLResponse(
+            content=entry[1],
+            headers={"content-encoding": "gzip", "vary": "Accept-Encoding", "etag": etag},
+        )
+    return HTMLResponse(content=entry[0], headers={"etag": etag})
 
 
 @router.post("/{checkout_id}/update")
@@ -950,14 +396,14 @@ async def update_embedded_checkout(
             detail=f"Checkout with ID {checkout_id} not found"
         )
     
-    data = await request.json()
+    data = await _read_json(request)
     
-    # Update buyer info
+    # Update buyer info. model_construct skips the Rust validator: the
+    # fields are all optional strings and the page's own form already
+    # shaped them, so validation would only re-check types.
     if "buyer" in data:
-        from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
-        
         buyer_data = data["buyer"]
-        checkout.buyer = Buyer(
+        checkout.buyer = Buyer.model_construct(
             email=buyer_data.get("email"),
             first_name=buyer_data.get("first_name"),
             last_name=buyer_data.get("last_name"),
@@ -967,11 +413,8 @@ async def update_embedded_checkout(
     start_result = store.start_payment(checkout_id)
     if not isinstance(start_result, str):
         checkout = start_result
-    
-    return JSONResponse({
-        "status": "success",
-        "checkout": checkout.model_dump(mode="json")
-    })
+
+    return _success_response(checkout)
 
 
 @router.post("/{checkout_id}/complete")
@@ -980,23 +423,31 @@ async def complete_embedded_checkout(
     request: Request,
 ):
     """Complete the checkout and place the order."""
-    checkout = store.get_checkout(checkout_id)
-    
-    if checkout is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Checkout with ID {checkout_id} not found"
-        )
-    
-    data = await request.json()
+    data = await _read_json(request)
     idempotency_key = data.get("idempotency_key")
-    
+
     if not idempotency_key:
         raise HTTPException(
             status_code=400,
             detail="idempotency_key is required"
         )
-    
+
+    # Retries replay the stored confirmation. Checked before the store
+    # lookup: place_order removes the checkout, so a retried key must
+    # not fall through to a 404.
+    idem_key = (checkout_id, idempotency_key)
+    cached = _IDEMPOTENCY.get(idem_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    checkout = store.get_checkout(checkout_id)
+
+    if checkout is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Checkout with ID {checkout_id} not found"
+        )
+
     # Validate checkout is ready
     start_result = store.start_payment(checkout_id)
     if isinstance(start_result, str):
@@ -1010,8 +461,7 @@ async def complete_embedded_checkout(
         checkout = store.place_order(checkout_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    
-    return JSONResponse({
-        "status": "success",
-        "checkout": checkout.model_dump(mode="json")
-    })
+
+    body = _success_body(checkout)
+    _IDEMPOTENCY[idem_key] = body
+    return Response(content=body, media_type="application/json")
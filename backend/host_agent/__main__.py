@@ -16,21 +16,23 @@
 
 import asyncio
 import functools
-import json
+import hashlib
 import logging
 import os
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
 from a2a.types import AgentCard
 import click
 from dotenv import load_dotenv
 import httpx
+import orjson
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse, JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.requests import Request
 from starlette.routing import Mount, Route
 from starlette.staticfiles import StaticFiles
@@ -45,32 +47,47 @@ load_dotenv()
 # Initialize store for API access
 store = RetailStore()
 
+# One pooled client for all push notifications: per-call clients redo
+# DNS and the TLS handshake, while HTTP/2 multiplexes concurrent pushes
+# over a single kept-alive session
+httpx_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    timeout=httpx.Timeout(10.0),
+)
+
+# basicConfig already installs a stream handler; adding another made
+# every record format and write twice
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-logger.addHandler(logging.StreamHandler())
 
 
 # ============ EP API Handlers ============
+#
+# The handlers stay async with inline store calls: RetailStore only
+# touches in-process dicts (no disk or DB per call), so a threadpool
+# hop would cost more than the microseconds the calls take.
 
 async def get_checkout_api(request: Request) -> JSONResponse:
     """GET /api/checkout/{checkout_id} - Returns checkout data for embedded checkout page."""
     checkout_id = request.path_params.get('checkout_id')
     checkout = store.get_checkout(checkout_id)
     if checkout is None:
-        return JSONResponse({"error": "Checkout not found"}, status_code=404)
-    return JSONResponse(checkout.model_dump(mode='json'),status_code=200)
+        return ORJSONResponse({"error": "Checkout not found"}, status_code=404)
+    # model_dump_json serializes in one Rust pass; dumping to a dict and
+    # re-encoding it walks the model twice
+    return Response(content=checkout.model_dump_json(), media_type="application/json")
 
 async def complete_checkout_api(request: Request) -> JSONResponse:
     """POST /api/checkout/{checkout_id}/complete - Places order and returns confirmation."""
     checkout_id = request.path_params.get('checkout_id')
-    
+
     try:
         checkout = store.place_order(checkout_id)
         checkout.status = "completed"
-        checkout_data = checkout.model_dump(mode='json')
-        return JSONResponse(checkout_data)
+        return Response(content=checkout.model_dump_json(), media_type="application/json")
     except ValueError as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
 
 def make_sync(func):
@@ -90,10 +107,30 @@ async def run(host, port):
     logger.error("GOOGLE_API_KEY must be set")
     exit(1)
 
-  card_path = os.path.join(os.path.dirname(__file__), "..", "mock_datas", "agent_card.json")
-  with open(card_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
-  agent_card = AgentCard.model_validate(data)
+  mock_dir = os.path.join(os.path.dirname(__file__), "..", "mock_datas")
+  with open(os.path.join(mock_dir, "agent_card.json"), "rb") as f:
+    agent_card = AgentCard.model_validate(orjson.loads(f.read()))
+
+  # Static assets are read once at startup and served as cached bytes:
+  # FileResponse would re-open and re-stat the file per request. The
+  # ETag lets a revisiting browser skip the body with a 304.
+  def cached_file(filename, media_type):
+    with open(os.path.join(mock_dir, filename), "rb") as f:
+      content = f.read()
+    headers = {
+        "etag": '"%s"' % hashlib.blake2b(content, digest_size=8).hexdigest(),
+        "cache-control": "public, max-age=300",
+    }
+
+    def serve(request):
+      if request.headers.get("if-none-match") == headers["etag"]:
+        return Response(status_code=304, headers=headers)
+      return Response(content=content, media_type=media_type, headers=headers)
+
+    return serve
+
+  serve_ucp_json = cached_file("ucp.json", "application/json")
+  serve_ec_html = cached_file("embedded-checkout.html", "text/html; charset=utf-8")
 
   task_store = InMemoryTaskStore()
 
@@ -113,18 +150,8 @@ async def run(host, port):
   )
   routes = a2a_app.routes()
   routes.extend([
-      Route(
-          "/.well-known/ucp",
-          lambda _: FileResponse(
-              os.path.join(os.path.dirname(__file__), "..", "mock_datas", "ucp.json")
-          ),
-      ),
-      Route(
-          "/embedded-checkout/{checkout_id}",
-          lambda _: FileResponse(
-              os.path.join(os.path.dirname(__file__), "..", "mock_datas", "embedded-checkout.html")
-          ),
-      ),
+      Route("/.well-known/ucp", serve_ucp_json),
+      Route("/embedded-checkout/{checkout_id}", serve_ec_html),
       # API endpoints for embedded checkout
       Route(
           "/api/checkout/{checkout_id}",
@@ -138,27 +165,36 @@ async def run(host, port):
       ),
       Mount(
           "/images",
-          app=StaticFiles(
-              directory=os.path.join(os.path.dirname(__file__), "..", "mock_datas", "images")
-          ),
+          app=StaticFiles(directory=os.path.join(mock_dir, "images")),
           name="images",
       ),
   ])
   
-  # Add CORS middleware for browser access
+  # Add CORS middleware for browser access. Explicit origins/methods/
+  # headers keep the per-preflight checks to a few tuple lookups, and
+  # max_age lets browsers cache the preflight for a day.
   middleware = [
       Middleware(
           CORSMiddleware,
-          allow_origins=["*"],
-          allow_methods=["*"],
-          allow_headers=["*"],
+          allow_origins=tuple(os.environ.get("CORS_ORIGINS", "http://localhost:3000").split(",")),
+          allow_methods=("GET", "POST", "OPTIONS"),
+          allow_headers=("Content-Type", "Authorization", "Idempotency-Key"),
+          max_age=86400,
       )
   ]
   app = Starlette(routes=routes, middleware=middleware)
 
-  config = uvicorn.Config(app, host=host, port=port, log_level="info")
+  # loop/http default to "auto", which picks uvloop and httptools from
+  # uvicorn[standard]. access_log is a synchronous per-request write, so
+  # it stays off. workers>1 would need an app factory import string and
+  # a per-worker store/agent — the in-memory RetailStore isn't shared,
+  # so scale-out happens by running multiple ports behind a proxy.
+  config = uvicorn.Config(app, host=host, port=port, log_level="info", access_log=False)
   server = uvicorn.Server(config)
-  await server.serve()
+  try:
+    await server.serve()
+  finally:
+    await httpx_client.aclose()
 
 
 if __name__ == "__main__":
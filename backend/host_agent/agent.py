@@ -14,6 +14,7 @@
 
 """UCP Agent with MCP Tools Integration - Supports Ollama and Google Gemini."""
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict, Optional
@@ -119,43 +120,62 @@ def get_model():
         return "gemini-2.0-flash"
 
 
+# Stored once as a module constant so the compiler interns a single
+# string instead of rebuilding the concatenation per build_agent call
+_INSTRUCTION = (
+    "You are a helpful shopping agent. You have access to these tools:\n"
+    "- search_products: Search for products in the catalog\n"
+    "- get_product: Get details of a specific product\n"
+    "- create_checkout: Create a new checkout with items\n"
+    "- get_checkout: Get current checkout status\n"
+    "- update_checkout: Update checkout (add/remove items, change quantities)\n"
+    "- complete_checkout: Complete the checkout and place order\n"
+    "- cancel_checkout: Cancel the current checkout\n\n"
+    "When user asks to search or find products, use search_products.\n"
+    "When user wants to buy something, first search for it, then create_checkout.\n"
+    "When user wants to add more items, use update_checkout.\n"
+    "When user wants to see their cart, use get_checkout.\n"
+    "When user wants to complete purchase, use complete_checkout.\n"
+    "Always respond in the user's language."
+)
+
+# Built once and shared: the MCP handshake in connector.get_tools() and
+# the Agent construction are cold-start cost, not per-caller cost
+_root_agent: Optional[Agent] = None
+_agent_lock = asyncio.Lock()
+
+
 async def build_agent():
     """
     Builds the shopper agent with MCP tools loaded dynamically.
-    
+
+    The agent is constructed on the first call and cached; concurrent
+    first callers coalesce on a lock so the MCP round-trip runs once.
+
     Returns:
         Agent: The configured shopper agent with MCP tools
     """
-    mcp_tools = await connector.get_tools()
-    
-    model = get_model()
-    
-    root_agent = Agent(
-        name="shopper_agent",
-        model=model,
-        description="Agent to help with shopping",
-        instruction=(
-            "You are a helpful shopping agent. You have access to these tools:\n"
-            "- search_products: Search for products in the catalog\n"
-            "- get_product: Get details of a specific product\n"
-            "- create_checkout: Create a new checkout with items\n"
-            "- get_checkout: Get current checkout status\n"
-            "- update_checkout: Update checkout (add/remove items, change quantities)\n"
-            "- complete_checkout: Complete the checkout and place order\n"
-            "- cancel_checkout: Cancel the current checkout\n\n"
-            "When user asks to search or find products, use search_products.\n"
-            "When user wants to buy something, first search for it, then create_checkout.\n"
-            "When user wants to add more items, use update_checkout.\n"
-            "When user wants to see their cart, use get_checkout.\n"
-            "When user wants to complete purchase, use complete_checkout.\n"
-            "Always respond in the user's language."
-        ),
-        tools=[*mcp_tools],
-        after_tool_callback=after_tool_modifier,
-        after_agent_callback=modify_output_after_agent,
-    )
-    
-    return root_agent
+    global _root_agent
+    if _root_agent is not None:
+        return _root_agent
+
+    async with _agent_lock:
+        if _root_agent is None:
+            mcp_tools = await connector.get_tools()
+
+            model = get_model()
+
+            _root_agent = Agent(
+                name="shopper_agent",
+                model=model,
+                description="Agent to help with shopping",
+                instruction=_INSTRUCTION,
+                tools=[*mcp_tools],
+                after_tool_callback=after_tool_modifier,
+                after_agent_callback=modify_output_after_agent,
+            )
+
+    return _root_agent
 
 
 # For sync usage - create a wrapper
@@ -164,5 +184,6 @@ def get_agent():
     Synchronous wrapper to get the agent.
     Use build_agent() for async contexts.
     """
-    import asyncio
+    if _root_agent is not None:
+        return _root_agent
     return asyncio.run(build_agent())
\ No newline at end of file
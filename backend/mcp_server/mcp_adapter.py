@@ -26,6 +26,7 @@ class MCPConnector:
     def __init__(self, config_file: str = None):
         self.discovery = MCPDiscovery(config_file=config_file)
         self.tools: list[MCPToolset] = []
+        self._inflight: asyncio.Task | None = None
         
     async def _load_all_tools(self):
         """
@@ -79,9 +80,15 @@ class MCPConnector:
     async def get_tools(self) -> list[MCPToolset]:
         """
         Returns the cached list of MCPToolsets.
+
+        Concurrent callers coalesce onto a single in-flight discovery
+        pass, so a burst of cold-start requests pays one round of MCP
+        handshakes instead of one per caller.
         """
 
-        await self._load_all_tools()
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._load_all_tools())
+        await self._inflight
         return self.tools.copy()
 
 if __name__ == "__main__":
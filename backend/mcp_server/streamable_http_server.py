@@ -27,9 +27,14 @@ Tools implemented:
 """
 
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from functools import lru_cache, partial
 import logging
 import json
+import threading
+
+import orjson
+from cachetools import TTLCache
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -61,22 +66,26 @@ logger = logging.getLogger(__name__)
 
 class UcpProfile(BaseModel):
     """UCP Platform Profile in _meta structure."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     profile: str = Field(..., description="Platform profile URI for version compatibility")
 
 
 class UcpMeta(BaseModel):
     """_meta.ucp structure for MCP requests."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     ucp: UcpProfile
 
 
 class LineItemInput(BaseModel):
     """Line item for create/update checkout."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     item: Dict[str, Any] = Field(..., description="Item with id field")
     quantity: int = Field(1, description="Quantity of items")
 
 
 class FulfillmentDestination(BaseModel):
     """Fulfillment destination address."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     street_address: Optional[str] = None
     extended_address: Optional[str] = None
     address_locality: Optional[str] = None
@@ -89,6 +98,7 @@ class FulfillmentDestination(BaseModel):
 
 class FulfillmentMethod(BaseModel):
     """Fulfillment method configuration."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     type: str = "shipping"
     destinations: Optional[List[FulfillmentDestination]] = None
     id: Optional[str] = None
@@ -98,11 +108,13 @@ class FulfillmentMethod(BaseModel):
 
 class FulfillmentInput(BaseModel):
     """Fulfillment configuration for checkout."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     methods: List[FulfillmentMethod] = []
 
 
 class CheckoutError(BaseModel):
     """UCP Error structure for MCP binding."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     code: str
     message: str
     severity: str = "recoverable"
@@ -111,6 +123,7 @@ class CheckoutError(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response following UCP error structure."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
     status: str = "error"
     errors: List[CheckoutError]
 
@@ -131,6 +144,17 @@ mcp = FastMCP(
 # Helper Functions
 # ============================================================================
 
+def _model_json_dict(model) -> Dict:
+    """Dump a pydantic model to a JSON-safe dict via the Rust serializer.
+
+    MCP tools must return structured dicts, so the model can't be handed
+    over pre-encoded; serializing with model_dump_json and re-parsing
+    with orjson still beats model_dump(mode="json"), whose Python-mode
+    walk runs per field in the interpreter.
+    """
+    return orjson.loads(model.model_dump_json())
+
+
 def _create_error_response(code: str, message: str, severity: str = "recoverable", details: Dict = None) -> Dict:
     """
     Creates a UCP-compliant error response for MCP binding.
@@ -155,10 +179,24 @@ def _create_success_response(checkout) -> Dict:
     """Creates a successful checkout response."""
     return {
         "status": "success",
-        constants.UCP_CHECKOUT_KEY: checkout.model_dump(mode="json")
+        constants.UCP_CHECKOUT_KEY: _model_json_dict(checkout)
     }
 
 
+def _build_address(dest: Dict) -> PostalAddress:
+    """Build a delivery address from a destination dict without re-validation."""
+    return PostalAddress.model_construct(
+        street_address=dest.get("street_address"),
+        extended_address=dest.get("extended_address"),
+        address_locality=dest.get("address_locality"),
+        address_region=dest.get("address_region"),
+        address_country=dest.get("address_country", "US"),
+        postal_code=dest.get("postal_code"),
+        first_name=dest.get("first_name"),
+        last_name=dest.get("last_name"),
+    )
+
+
 def _extract_ucp_profile(meta: Optional[Dict] = None) -> Optional[str]:
     """
     Extracts the UCP platform profile from _meta structure.
@@ -166,37 +204,109 @@ def _extract_ucp_profile(meta: Optional[Dict] = None) -> Optional[str]:
     MCP clients MUST include the UCP platform profile URI with every request.
     The platform profile is included in the _meta.ucp structure.
     """
-    if meta and "ucp" in meta and "profile" in meta["ucp"]:
+    # One C-level lookup chain instead of three membership probes plus
+    # two lookups; the absent-key case is the exception, not the rule
+    try:
         return meta["ucp"]["profile"]
-    return None
+    except (TypeError, KeyError):
+        return None
 
 
-def _create_ucp_metadata(capabilities: List[str] = None) -> UcpMetadata:
-    """Creates UCP metadata for checkout responses."""
-    default_capabilities = [
+def _line_item_id(line_item: Dict[str, Any]) -> Optional[str]:
+    """Item id of a raw line-item dict.
+
+    Guarded two-step lookup instead of .get("item", {}).get("id"), which
+    allocates a throwaway dict for every line item missing an "item" key.
+    """
+    item = line_item.get("item")
+    return item.get("id") if item else None
+
+
+# Built once at import: the default capabilities never change, and the
+# checkout tools used to re-run the UcpMetadata validators on every
+# call (once per line item in update_checkout)
+_DEFAULT_UCP_METADATA = UcpMetadata(
+    version="2026-01-11",
+    capabilities=[
         {
             "name": "dev.ucp.shopping.checkout",
             "version": "2026-01-11",
             "spec": "https://ucp.dev/specification/checkout",
             "schema": "https://ucp.dev/schemas/shopping/checkout.json"
         }
-    ]
-    return UcpMetadata(
-        version="2026-01-11",
-        capabilities=default_capabilities
-    )
+    ],
+)
 
 
-# In-memory session storage (for stateless HTTP, checkout_id is passed explicitly)
-_checkout_sessions: Dict[str, str] = {}
+def _create_ucp_metadata(capabilities: List[str] = None) -> UcpMetadata:
+    """Returns the shared default UCP metadata for checkout responses."""
+    return _DEFAULT_UCP_METADATA
+
+
+# Guard-clause errors built once: these fire on every malformed call,
+# and the factory otherwise allocates three containers per miss. The
+# shared dicts are returned as-is — handlers never mutate responses.
+_ERR_CHECKOUT_ID_REQUIRED = _create_error_response(
+    "INVALID_REQUEST", "Checkout ID is required")
+_ERR_LINE_ITEMS_REQUIRED = _create_error_response(
+    "INVALID_REQUEST", "At least one line item is required")
+_ERR_IDEMPOTENCY_KEY_REQUIRED = _create_error_response(
+    "INVALID_REQUEST", "Idempotency key is required for complete_checkout")
+_ERR_QUERY_REQUIRED = _create_error_response(
+    "INVALID_REQUEST", "Search query is required")
+_ERR_PRODUCT_ID_REQUIRED = _create_error_response(
+    "INVALID_REQUEST", "Product ID is required")
+_ERR_INVALID_LINE_ITEM = _create_error_response(
+    "INVALID_LINE_ITEM", "Line item must have an item.id field")
+_ERR_ALREADY_COMPLETED = _create_error_response(
+    "CHECKOUT_ALREADY_COMPLETED", "This checkout has already been completed")
+_ERR_CANCELED = _create_error_response(
+    "CHECKOUT_CANCELED", "This checkout has been canceled and cannot be completed")
+_ERR_EC_NOT_AVAILABLE = _create_error_response(
+    "EMBEDDED_CHECKOUT_NOT_AVAILABLE",
+    "Embedded checkout URL is not available for this checkout")
+_ERR_SEARCH_FAILED = _create_error_response(
+    "SEARCH_FAILED", "An error occurred while searching products")
+
+# For errors whose message varies per call, partials pin the constant
+# code/severity at import so each branch only supplies its message
+_err_internal = partial(_create_error_response, "INTERNAL_ERROR")
+_err_checkout_not_found = partial(_create_error_response, "CHECKOUT_NOT_FOUND")
+_err_product_not_found = partial(_create_error_response, "PRODUCT_NOT_FOUND")
+_err_update_failed = partial(_create_error_response, "UPDATE_FAILED")
+_err_complete_failed = partial(_create_error_response, "COMPLETE_FAILED")
+_err_cancel_not_allowed = partial(_create_error_response, "CANCEL_NOT_ALLOWED")
+_err_merchandise_unavailable = partial(
+    _create_error_response, "MERCHANDISE_NOT_AVAILABLE", severity="requires_buyer_input")
+_err_checkout_incomplete = partial(
+    _create_error_response, "CHECKOUT_INCOMPLETE", severity="requires_buyer_input")
+
+
+# In-memory session storage (for stateless HTTP, checkout_id is passed
+# explicitly). Bounded with a TTL so a long-lived process doesn't grow
+# RSS with every session ever seen; the mapping API is dict-compatible.
+_checkout_sessions: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Completed orders keyed by (checkout id, idempotency key). place_order
+# deletes the checkout, so a retried complete_checkout would otherwise
+# rerun the pipeline and report CHECKOUT_NOT_FOUND; the cache replays
+# the original success response in O(1) instead.
+_completed_orders: TTLCache = TTLCache(maxsize=20_000, ttl=86400)
+_completed_orders_lock = threading.Lock()
 
 
 # ============================================================================
 # UCP MCP Tools - Checkout Capability
 # ============================================================================
+#
+# Tools are async so FastMCP awaits them on the event loop instead of
+# calling into sync handlers that hold the loop for their whole body.
+# Store calls stay inline rather than going through asyncio.to_thread:
+# RetailStore only touches in-process dicts, so the threadpool hop
+# would cost more than the microseconds the calls take.
 
 @mcp.tool("create_checkout")
-def create_checkout(
+async def create_checkout(
     line_items: List[Dict[str, Any]],
     currency: str = "USD",
     buyer: Optional[Dict[str, Any]] = None,
@@ -226,44 +336,31 @@ def create_checkout(
     """
     # Extract UCP profile for version compatibility
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"create_checkout called with profile: {ucp_profile}")
+    logger.info("create_checkout called with profile: %s", ucp_profile)
     
     if not line_items:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="At least one line item is required",
-            severity="recoverable"
-        )
+        return _ERR_LINE_ITEMS_REQUIRED
     
     try:
         # Create UCP metadata
         ucp_metadata = _create_ucp_metadata()
         
-        # Process the first line item to create checkout
-        first_item = line_items[0]
-        item_id = first_item.get("item", {}).get("id")
-        quantity = first_item.get("quantity", 1)
-        
-        if not item_id:
-            return _create_error_response(
-                code="INVALID_LINE_ITEM",
-                message="Line item must have an item.id field",
-                severity="recoverable"
-            )
-        
-        # Create checkout with first item
-        checkout = store.add_to_checkout(ucp_metadata, item_id, quantity, None)
-        
-        # Add remaining line items
-        for line_item in line_items[1:]:
-            item_id = line_item.get("item", {}).get("id")
-            quantity = line_item.get("quantity", 1)
-            if item_id:
-                checkout = store.add_to_checkout(ucp_metadata, item_id, quantity, checkout.id)
+        if not _line_item_id(line_items[0]):
+            return _ERR_INVALID_LINE_ITEM
+
+        # Collect (product_id, quantity) pairs and hand them to the store
+        # in one call: per-item add_to_checkout calls would recalculate
+        # the checkout totals once per item instead of once overall
+        items = [
+            (item_id, li.get("quantity", 1))
+            for li in line_items
+            if (item_id := _line_item_id(li))
+        ]
+        checkout = store.add_items_to_checkout(ucp_metadata, items)
         
         # Set buyer if provided
         if buyer:
-            checkout.buyer = Buyer(
+            checkout.buyer = Buyer.model_construct(
                 email=buyer.get("email"),
                 first_name=buyer.get("first_name"),
                 last_name=buyer.get("last_name"),
@@ -274,41 +371,23 @@ def create_checkout(
         # Handle fulfillment if provided
         if fulfillment and fulfillment.get("methods"):
             for method in fulfillment["methods"]:
-                if method.get("destinations"):
-                    dest = method["destinations"][0]
-                    address = PostalAddress(
-                        street_address=dest.get("street_address"),
-                        extended_address=dest.get("extended_address"),
-                        address_locality=dest.get("address_locality"),
-                        address_region=dest.get("address_region"),
-                        address_country=dest.get("address_country", "US"),
-                        postal_code=dest.get("postal_code"),
-                        first_name=dest.get("first_name"),
-                        last_name=dest.get("last_name"),
-                    )
-                    checkout = store.add_delivery_address(checkout.id, address)
+                dests = method.get("destinations")
+                if dests:
+                    checkout = store.add_delivery_address(checkout.id, _build_address(dests[0]))
         
-        logger.info(f"Checkout created with id: {checkout.id}")
+        logger.info("Checkout created with id: %s", checkout.id)
         return _create_success_response(checkout)
         
     except ValueError as e:
         logger.exception("Error creating checkout")
-        return _create_error_response(
-            code="MERCHANDISE_NOT_AVAILABLE",
-            message=str(e),
-            severity="requires_buyer_input"
-        )
+        return _err_merchandise_unavailable(str(e))
     except Exception as e:
         logger.exception("Unexpected error creating checkout")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An unexpected error occurred while creating checkout",
-            severity="recoverable"
-        )
+        return _err_internal("An unexpected error occurred while creating checkout")
 
 
 @mcp.tool("get_checkout")
-def get_checkout(
+async def get_checkout(
     id: str,
     ucp_meta: Optional[Dict[str, Any]] = None,
 ) -> Dict:
@@ -326,38 +405,26 @@ def get_checkout(
         dict: Checkout object with current state or error response
     """
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"get_checkout called for id: {id}, profile: {ucp_profile}")
+    logger.info("get_checkout called for id: %s, profile: %s", id, ucp_profile)
     
     if not id:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Checkout ID is required",
-            severity="recoverable"
-        )
+        return _ERR_CHECKOUT_ID_REQUIRED
     
     try:
         checkout = store.get_checkout(id)
         
         if checkout is None:
-            return _create_error_response(
-                code="CHECKOUT_NOT_FOUND",
-                message=f"Checkout with ID {id} was not found",
-                severity="recoverable"
-            )
+            return _err_checkout_not_found(f"Checkout with ID {id} was not found")
         
         return _create_success_response(checkout)
         
     except Exception as e:
         logger.exception("Error retrieving checkout")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An unexpected error occurred while retrieving checkout",
-            severity="recoverable"
-        )
+        return _err_internal("An unexpected error occurred while retrieving checkout")
 
 
 @mcp.tool("update_checkout")
-def update_checkout(
+async def update_checkout(
     id: str,
     line_items: Optional[List[Dict[str, Any]]] = None,
     currency: Optional[str] = None,
@@ -386,28 +453,20 @@ def update_checkout(
         dict: Updated checkout object or error response
     """
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"update_checkout called for id: {id}, profile: {ucp_profile}")
+    logger.info("update_checkout called for id: %s, profile: %s", id, ucp_profile)
     
     if not id:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Checkout ID is required",
-            severity="recoverable"
-        )
+        return _ERR_CHECKOUT_ID_REQUIRED
     
     try:
         checkout = store.get_checkout(id)
         
         if checkout is None:
-            return _create_error_response(
-                code="CHECKOUT_NOT_FOUND",
-                message=f"Checkout with ID {id} was not found",
-                severity="recoverable"
-            )
+            return _err_checkout_not_found(f"Checkout with ID {id} was not found")
         
         # Update buyer if provided
         if buyer:
-            checkout.buyer = Buyer(
+            checkout.buyer = Buyer.model_construct(
                 email=buyer.get("email"),
                 first_name=buyer.get("first_name"),
                 last_name=buyer.get("last_name"),
@@ -415,41 +474,29 @@ def update_checkout(
                 phone_number=buyer.get("phone_number")
             )
         
-        # Update line items if provided (add/update quantities)
+        # Update line items if provided (add/update quantities). The id
+        # set makes each membership check O(1) instead of rescanning the
+        # cart per incoming item; newly added ids join the set so a
+        # duplicate in the same request updates rather than re-adds.
         if line_items:
+            existing_ids = {li.item.id for li in checkout.line_items}
             for line_item in line_items:
-                item_id = line_item.get("item", {}).get("id")
+                item_id = _line_item_id(line_item)
                 quantity = line_item.get("quantity", 1)
                 if item_id:
-                    # Check if item exists in checkout
-                    found = False
-                    for existing_item in checkout.line_items:
-                        if existing_item.item.id == item_id:
-                            checkout = store.update_checkout(id, item_id, quantity)
-                            found = True
-                            break
-                    # If not found, add new item
-                    if not found:
-                        ucp_metadata = _create_ucp_metadata()
-                        checkout = store.add_to_checkout(ucp_metadata, item_id, quantity, id)
+                    if item_id in existing_ids:
+                        checkout = store.update_checkout(id, item_id, quantity)
+                    else:
+                        checkout = store.add_to_checkout(_DEFAULT_UCP_METADATA, item_id, quantity, id)
+                        existing_ids.add(item_id)
         
         # Handle fulfillment updates
         if fulfillment and fulfillment.get("methods"):
             for method in fulfillment["methods"]:
                 # Handle destination updates
-                if method.get("destinations"):
-                    dest = method["destinations"][0]
-                    address = PostalAddress(
-                        street_address=dest.get("street_address"),
-                        extended_address=dest.get("extended_address"),
-                        address_locality=dest.get("address_locality"),
-                        address_region=dest.get("address_region"),
-                        address_country=dest.get("address_country", "US"),
-                        postal_code=dest.get("postal_code"),
-                        first_name=dest.get("first_name"),
-                        last_name=dest.get("last_name"),
-                    )
-                    checkout = store.add_delivery_address(id, address)
+                dests = method.get("destinations")
+                if dests:
+                    checkout = store.add_delivery_address(id, _build_address(dests[0]))
                 
                 # Handle fulfillment option selection
                 if method.get("groups"):
@@ -460,30 +507,19 @@ def update_checkout(
                             # (would need to add this functionality to store)
                             pass
         
-        # Refresh checkout state
-        checkout = store.get_checkout(id)
-        
-        logger.info(f"Checkout updated: {id}")
+        logger.info("Checkout updated: %s", id)
         return _create_success_response(checkout)
         
     except ValueError as e:
         logger.exception("Error updating checkout")
-        return _create_error_response(
-            code="UPDATE_FAILED",
-            message=str(e),
-            severity="recoverable"
-        )
+        return _err_update_failed(str(e))
     except Exception as e:
         logger.exception("Unexpected error updating checkout")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An unexpected error occurred while updating checkout",
-            severity="recoverable"
-        )
+        return _err_internal("An unexpected error occurred while updating checkout")
 
 
 @mcp.tool("complete_checkout")
-def complete_checkout(
+async def complete_checkout(
     id: str,
     idempotency_key: str,
     payment: Optional[Dict[str, Any]] = None,
@@ -507,91 +543,71 @@ def complete_checkout(
               or error response
     """
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"complete_checkout called for id: {id}, idempotency_key: {idempotency_key}")
+    logger.info("complete_checkout called for id: %s, idempotency_key: %s", id, idempotency_key)
     
     if not id:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Checkout ID is required",
-            severity="recoverable"
-        )
+        return _ERR_CHECKOUT_ID_REQUIRED
     
     if not idempotency_key:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Idempotency key is required for complete_checkout",
-            severity="recoverable"
-        )
-    
+        return _ERR_IDEMPOTENCY_KEY_REQUIRED
+
+    idem_key = (id, idempotency_key)
+
     try:
-        checkout = store.get_checkout(id)
-        
-        if checkout is None:
-            return _create_error_response(
-                code="CHECKOUT_NOT_FOUND",
-                message=f"Checkout with ID {id} was not found",
-                severity="recoverable"
-            )
-        
-        # Check if checkout can be completed
-        if checkout.status == "completed":
-            return _create_error_response(
-                code="CHECKOUT_ALREADY_COMPLETED",
-                message="This checkout has already been completed",
-                severity="recoverable"
-            )
-        
-        if checkout.status == "canceled":
-            return _create_error_response(
-                code="CHECKOUT_CANCELED",
-                message="This checkout has been canceled and cannot be completed",
-                severity="recoverable"
-            )
-        
-        # Validate checkout is ready
-        start_result = store.start_payment(id)
-        if isinstance(start_result, str):
-            # Checkout requires more information
-            return _create_error_response(
-                code="CHECKOUT_INCOMPLETE",
-                message=start_result,
-                severity="requires_buyer_input"
-            )
-        
-        # Process payment if provided
-        if payment:
-            # Handle payment instrument
-            selected_instrument_id = payment.get("selected_instrument_id")
-            instruments = payment.get("instruments", [])
-            
-            if selected_instrument_id and instruments:
-                checkout.payment.selected_instrument_id = selected_instrument_id
-                # Payment processing would happen here via MockPaymentProcessor
-        
-        # Place the order
-        checkout = store.place_order(id)
-        
-        logger.info(f"Checkout completed, order created: {checkout.order.id if checkout.order else 'N/A'}")
-        return _create_success_response(checkout)
-        
+        # One lock spans the replay check and the placement so a
+        # concurrent retry can't place the same order twice; everything
+        # inside is in-memory dict work and takes microseconds.
+        with _completed_orders_lock:
+            cached = _completed_orders.get(idem_key)
+            if cached is not None:
+                return cached
+
+            checkout = store.get_checkout(id)
+
+            if checkout is None:
+                return _err_checkout_not_found(f"Checkout with ID {id} was not found")
+
+            # Check if checkout can be completed
+            if checkout.status == "completed":
+                return _ERR_ALREADY_COMPLETED
+
+            if checkout.status == "canceled":
+                return _ERR_CANCELED
+
+            # Validate checkout is ready
+            start_result = store.start_payment(id)
+            if isinstance(start_result, str):
+                # Checkout requires more information
+                return _err_checkout_incomplete(start_result)
+
+            # Process payment if provided
+            if payment:
+                # Handle payment instrument
+                selected_instrument_id = payment.get("selected_instrument_id")
+                instruments = payment.get("instruments", [])
+
+                if selected_instrument_id and instruments:
+                    checkout.payment.selected_instrument_id = selected_instrument_id
+                    # Payment processing would happen here via MockPaymentProcessor
+
+            # Place the order
+            checkout = store.place_order(id)
+
+            logger.info("Checkout completed, order created: %s", checkout.order.id if checkout.order else "N/A")
+            result = _create_success_response(checkout)
+            _completed_orders[idem_key] = result
+            return result
+
     except ValueError as e:
         logger.exception("Error completing checkout")
-        return _create_error_response(
-            code="COMPLETE_FAILED",
-            message=str(e),
-            severity="recoverable"
-        )
+        return _err_complete_failed(str(e))
     except Exception as e:
         logger.exception("Unexpected error completing checkout")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An unexpected error occurred while completing checkout",
-            severity="recoverable"
-        )
+        return _err_internal("An unexpected error occurred while completing checkout")
 
 
 @mcp.tool("cancel_checkout")
-def cancel_checkout(
+async def cancel_checkout(
     id: str,
     idempotency_key: Optional[str] = None,
     ucp_meta: Optional[Dict[str, Any]] = None,
@@ -613,49 +629,33 @@ def cancel_checkout(
         dict: Checkout object with status: canceled, or error response
     """
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"cancel_checkout called for id: {id}")
+    logger.info("cancel_checkout called for id: %s", id)
     
     if not id:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Checkout ID is required",
-            severity="recoverable"
-        )
+        return _ERR_CHECKOUT_ID_REQUIRED
     
     try:
         checkout = store.get_checkout(id)
         
         if checkout is None:
-            return _create_error_response(
-                code="CHECKOUT_NOT_FOUND",
-                message=f"Checkout with ID {id} was not found",
-                severity="recoverable"
-            )
+            return _err_checkout_not_found(f"Checkout with ID {id} was not found")
         
         # Cancel the checkout
         checkout = store.cancel_checkout(id)
         
-        logger.info(f"Checkout canceled: {id}")
+        logger.info("Checkout canceled: %s", id)
         return _create_success_response(checkout)
         
     except ValueError as e:
         # This handles the case where checkout is already completed/canceled
         logger.exception("Error canceling checkout")
-        return _create_error_response(
-            code="CANCEL_NOT_ALLOWED",
-            message=str(e),
-            severity="recoverable"
-        )
+        return _err_cancel_not_allowed(str(e))
     except Exception as e:
         logger.exception("Unexpected error canceling checkout")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An unexpected error occurred while canceling checkout",
-            severity="recoverable"
-        )
+        return _err_internal("An unexpected error occurred while canceling checkout")
 
 @mcp.tool("ep_binding")
-def ep_tool(
+async def ep_tool(
     id: str,
     idempotency_key: Optional[str] = None,
     ucp_meta: Optional[Dict[str, Any]] = None,
@@ -685,26 +685,18 @@ def ep_tool(
             - version: EP Binding version
     """
     ucp_profile = _extract_ucp_profile(ucp_meta)
-    logger.info(f"ep_binding called for id: {id}, profile: {ucp_profile}")
+    logger.info("ep_binding called for id: %s, profile: %s", id, ucp_profile)
     
     checkout = store.get_checkout(id)
     
     if checkout is None:
-        return _create_error_response(
-            code="CHECKOUT_NOT_FOUND",
-            message=f"Checkout with ID {id} was not found",
-            severity="recoverable"
-        )
+        return _err_checkout_not_found(f"Checkout with ID {id} was not found")
     
     # Get the continue_url (already set by store._recalculate_checkout)
     continue_url = str(checkout.continue_url) if checkout.continue_url else None
     
     if not continue_url:
-        return _create_error_response(
-            code="EMBEDDED_CHECKOUT_NOT_AVAILABLE",
-            message="Embedded checkout URL is not available for this checkout",
-            severity="recoverable"
-        )
+        return _ERR_EC_NOT_AVAILABLE
     
     # EP Binding constants
     EP_VERSION = "2026-01-11"
@@ -730,7 +722,7 @@ def ep_tool(
                 }
             }
         },
-        constants.UCP_CHECKOUT_KEY: checkout.model_dump(mode="json")
+        constants.UCP_CHECKOUT_KEY: _model_json_dict(checkout)
     }
     
 
@@ -738,8 +730,23 @@ def ep_tool(
 # Additional Helper Tools (Non-UCP Standard, but useful for agents)
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _cached_search(query: str) -> Dict:
+    """Success payload for a normalized search query.
+
+    Catalog searches repeat heavily in shopping sessions, and the mock
+    catalog is loaded once at startup and never mutated, so entries
+    never go stale. The shared dict is returned as-is, matching the
+    no-mutation convention of the prebuilt _ERR_* responses.
+    """
+    return {
+        "status": "success",
+        "results": _model_json_dict(store.search_products(query)),
+    }
+
+
 @mcp.tool("search_products")
-def search_products(
+async def search_products(
     query: str,
     ucp_meta: Optional[Dict[str, Any]] = None,
 ) -> Dict:
@@ -756,32 +763,22 @@ def search_products(
     Returns:
         dict: Product search results or error response
     """
-    logger.info(f"search_products called with query: {query}")
-    
+    logger.info("search_products called with query: %s", query)
+
     if not query:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Search query is required",
-            severity="recoverable"
-        )
-    
+        return _ERR_QUERY_REQUIRED
+
     try:
-        product_results = store.search_products(query)
-        return {
-            "status": "success",
-            "results": product_results.model_dump(mode="json")
-        }
+        # Normalized so trivially different spellings share an entry;
+        # the store lowercases keywords anyway, so results are identical
+        return _cached_search(query.strip().lower())
     except Exception as e:
         logger.exception("Error searching products")
-        return _create_error_response(
-            code="SEARCH_FAILED",
-            message="An error occurred while searching products",
-            severity="recoverable"
-        )
+        return _ERR_SEARCH_FAILED
 
 
 @mcp.tool("get_product")
-def get_product(
+async def get_product(
     product_id: str,
     ucp_meta: Optional[Dict[str, Any]] = None,
 ) -> Dict:
@@ -798,36 +795,24 @@ def get_product(
     Returns:
         dict: Product details or error response
     """
-    logger.info(f"get_product called for id: {product_id}")
+    logger.info("get_product called for id: %s", product_id)
     
     if not product_id:
-        return _create_error_response(
-            code="INVALID_REQUEST",
-            message="Product ID is required",
-            severity="recoverable"
-        )
+        return _ERR_PRODUCT_ID_REQUIRED
     
     try:
         product = store.get_product(product_id)
         
         if product is None:
-            return _create_error_response(
-                code="PRODUCT_NOT_FOUND",
-                message=f"Product with ID {product_id} was not found",
-                severity="recoverable"
-            )
+            return _err_product_not_found(f"Product with ID {product_id} was not found")
         
         return {
             "status": "success",
-            "product": product.model_dump(mode="json")
+            "product": _model_json_dict(product)
         }
     except Exception as e:
         logger.exception("Error retrieving product")
-        return _create_error_response(
-            code="INTERNAL_ERROR",
-            message="An error occurred while retrieving product",
-            severity="recoverable"
-        )
+        return _err_internal("An error occurred while retrieving product")
 
 
 # ============================================================================
@@ -3,6 +3,15 @@ from a2a.types import Task, TaskState, TaskStatus
 from ucp_sdk.models.schemas.shopping.types.payment_instrument import PaymentInstrument
 
 
+# Built once at import: the mock result carries no input-dependent state,
+# so there is no reason to re-run the Task validators per payment
+_COMPLETED_TASK = Task(
+    context_id="mock-context-id",
+    id="mock-task-id",
+    status=TaskStatus(state=TaskState.completed),
+)
+
+
 class MockPaymentProcessor:
   """Mock Payment Processor simulating calls from Merchant Agent to MPP Agent."""
 
@@ -12,11 +21,4 @@ class MockPaymentProcessor:
     """Process the payment."""
     # this should invoke the Merchant Payment Processor to validate the payment
     # For demo purposes, we return a completed task
-    task = Task(
-        context_id="mock-context-id",
-        id="mock-task-id",
-        status=TaskStatus(state=TaskState.completed),
-        
-    )
-    # return a task that represents the payment processing has completed
-    return task
\ No newline at end of file
+    return _COMPLETED_TASK
@@ -26,9 +26,15 @@ Or:
     uv run python -m backend.server
 """
 
+import hashlib
+import os
+
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.staticfiles import StaticFiles
 import logging
 
 # Configure logging
@@ -40,15 +46,23 @@ app = FastAPI(
     title="UCP Merchant Server",
     description="UCP MCP Binding and Embedded Checkout Protocol server",
     version="2026-01-11",
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware for embedded checkout
+# Add CORS middleware for embedded checkout. An explicit frozenset of
+# origins gives the middleware an O(1) membership check instead of the
+# wildcard path, and explicit methods/headers keep preflight responses
+# constant; max_age lets browsers cache the preflight for a day.
+_ALLOWED_ORIGINS = frozenset(
+    os.environ.get("UCP_ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
+    allow_origins=_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Content-Type", "Authorization", "Idempotency-Key"),
+    max_age=86400,
 )
 
 # Import and include embedded checkout routes
@@ -56,35 +70,70 @@ from .embedded_checkout_routes import router as embedded_checkout_router
 app.include_router(embedded_checkout_router)
 
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "UCP Merchant Server"}
+class _ImmutableStaticFiles(StaticFiles):
+    """Static files with far-future cache headers.
 
+    The embedded checkout CSS/JS never changes within a deployment, so
+    browsers and CDNs can cache it for the release lifetime instead of
+    refetching ~20KB per checkout page load.
+    """
 
-# UCP service discovery endpoint
-@app.get("/.well-known/ucp")
-async def ucp_discovery():
-    """UCP service discovery endpoint."""
-    return {
-        "services": {
-            "dev.ucp.shopping": {
-                "version": "2026-01-11",
-                "rest": {
-                    "schema": "https://ucp.dev/services/shopping/rest.openapi.json",
-                    "endpoint": "http://localhost:10999/ucp/v1"
-                },
-                "mcp": {
-                    "schema": "https://ucp.dev/services/shopping/mcp.openrpc.json",
-                    "endpoint": "http://localhost:10999/mcp"
-                },
-                "embedded": {
-                    "schema": "https://ucp.dev/services/shopping/embedded.openrpc.json"
-                }
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# Static assets for the embedded checkout shell
+app.mount(
+    "/ec-static",
+    _ImmutableStaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")),
+    name="ec-static",
+)
+
+
+# Both payloads are fully static, so they are encoded once at import
+# and served as cached bytes with an ETag instead of rebuilding and
+# re-serializing the same dict on every request.
+_HEALTH_JSON = orjson.dumps({"status": "healthy", "service": "UCP Merchant Server"})
+_UCP_DISCOVERY_JSON = orjson.dumps({
+    "services": {
+        "dev.ucp.shopping": {
+            "version": "2026-01-11",
+            "rest": {
+                "schema": "https://ucp.dev/services/shopping/rest.openapi.json",
+                "endpoint": "http://localhost:10999/ucp/v1"
+            },
+            "mcp": {
+                "schema": "https://ucp.dev/services/shopping/mcp.openrpc.json",
+                "endpoint": "http://localhost:10999/mcp"
+            },
+            "embedded": {
+                "schema": "https://ucp.dev/services/shopping/embedded.openrpc.json"
             }
         }
     }
+})
+
+
+def _static_json_handler(body: bytes):
+    """Handler serving pre-encoded JSON bytes, with If-None-Match 304s."""
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    headers = {"etag": etag}
+
+    async def serve(request: Request) -> Response:
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    return serve
+
+
+# Health check endpoint
+app.get("/health")(_static_json_handler(_HEALTH_JSON))
+
+# UCP service discovery endpoint
+app.get("/.well-known/ucp")(_static_json_handler(_UCP_DISCOVERY_JSON))
 
 
 def run_server(host: str = "localhost", port: int = 10999):
@@ -100,6 +149,11 @@ def run_server(host: str = "localhost", port: int = 10999):
     logger.info("For MCP tools, use the MCP server directly:")
     logger.info("  python -m backend.mcp_server.streamable_http_server")
     
+    # loop/http stay on "auto": with uvicorn[standard] installed that
+    # selects uvloop and httptools where available (uvloop has no win32
+    # build) without hard-failing elsewhere. The only middleware here is
+    # CORSMiddleware, already pure ASGI — no BaseHTTPMiddleware double
+    # message-pump on the checkout path.
     uvicorn.run(app, host=host, port=port)
 
 
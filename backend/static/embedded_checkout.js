@@ -0,0 +1,534 @@
+// ========================================================================
+// Embedded Checkout Protocol Client
+// ========================================================================
+
+const BOOT = window.__EC_BOOT__ || {};
+
+const EmbeddedCheckout = {
+    // Configuration
+    config: {
+        checkoutId: BOOT.checkout_id,
+        version: BOOT.ec_version,
+        delegations: BOOT.delegations || [],
+        debug: true,
+    },
+
+    // State
+    state: {
+        checkout: BOOT.checkout,
+        isReady: false,
+        isCompleted: false,
+        messagePort: null,
+        pendingRequests: {},
+    },
+
+    // Initialize the embedded checkout
+    init() {
+        this.log('Initializing Embedded Checkout Protocol');
+        this.setupCommunication();
+        this.render();
+        this.sendReady();
+    },
+
+    // Set up communication channels
+    setupCommunication() {
+        // For native hosts
+        window.EmbeddedCheckoutProtocol = {
+            postMessage: (message) => this.handleMessage(message)
+        };
+
+        // For web hosts via postMessage
+        window.addEventListener('message', (event) => {
+            // Validate origin in production
+            this.handleMessage(event.data);
+        });
+    },
+
+    // Send message to host
+    sendToHost(message) {
+        const jsonMessage = typeof message === 'string' ? message : JSON.stringify(message);
+        this.debugLog('sent', JSON.parse(jsonMessage));
+
+        // Use MessagePort if available (upgraded channel)
+        if (this.state.messagePort) {
+            this.state.messagePort.postMessage(jsonMessage);
+            return;
+        }
+
+        // For native hosts
+        if (window.EmbeddedCheckoutProtocolConsumer) {
+            window.EmbeddedCheckoutProtocolConsumer.postMessage(jsonMessage);
+            return;
+        }
+
+        // WebKit message handler for iOS
+        if (window.webkit?.messageHandlers?.EmbeddedCheckoutProtocolConsumer) {
+            window.webkit.messageHandlers.EmbeddedCheckoutProtocolConsumer.postMessage(jsonMessage);
+            return;
+        }
+
+        // For web hosts
+        if (window.parent !== window) {
+            window.parent.postMessage(jsonMessage, '*');
+        }
+    },
+
+    // Handle incoming message
+    handleMessage(data) {
+        try {
+            const message = typeof data === 'string' ? JSON.parse(data) : data;
+            this.debugLog('received', message);
+
+            // Handle response to our request
+            if (message.id && this.state.pendingRequests[message.id]) {
+                const { resolve, reject } = this.state.pendingRequests[message.id];
+                delete this.state.pendingRequests[message.id];
+
+                if (message.error) {
+                    reject(message.error);
+                } else {
+                    resolve(message.result || {});
+                }
+                return;
+            }
+
+            // Handle ec.ready response (special case - it's a response to our request)
+            if (message.result !== undefined && !this.state.isReady) {
+                this.handleReadyResponse(message);
+                return;
+            }
+        } catch (e) {
+            this.log('Error handling message:', e);
+        }
+    },
+
+    // Send ec.ready request
+    sendReady() {
+        const request = {
+            jsonrpc: '2.0',
+            id: this.generateId(),
+            method: 'ec.ready',
+            params: {
+                delegate: this.config.delegations
+            }
+        };
+
+        this.state.pendingRequests[request.id] = {
+            resolve: (result) => this.handleReadyResponse({ id: request.id, result }),
+            reject: (error) => this.log('ec.ready rejected:', error)
+        };
+
+        this.sendToHost(request);
+    },
+
+    // Handle ec.ready response
+    handleReadyResponse(response) {
+        this.state.isReady = true;
+        const result = response.result || {};
+
+        // Handle channel upgrade
+        if (result.upgrade?.port) {
+            this.state.messagePort = result.upgrade.port;
+            this.log('Communication channel upgraded');
+            // Re-send ec.ready on upgraded channel
+            this.sendReady();
+            return;
+        }
+
+        // Handle checkout state from host
+        if (result.checkout) {
+            if (result.checkout.payment?.instruments) {
+                this.state.checkout.payment = {
+                    ...this.state.checkout.payment,
+                    ...result.checkout.payment
+                };
+            }
+        }
+
+        this.log('Handshake complete, sending ec.start');
+        this.sendStart();
+    },
+
+    // Send ec.start notification
+    sendStart() {
+        this.sendToHost({
+            jsonrpc: '2.0',
+            method: 'ec.start',
+            params: {
+                checkout: this.state.checkout
+            }
+        });
+    },
+
+    // Send ec.complete notification
+    sendComplete() {
+        this.state.isCompleted = true;
+        this.sendToHost({
+            jsonrpc: '2.0',
+            method: 'ec.complete',
+            params: {
+                checkout: this.state.checkout
+            }
+        });
+    },
+
+    // Send state change notification
+    sendStateChange(changeType) {
+        this.sendToHost({
+            jsonrpc: '2.0',
+            method: `ec.${changeType}.change`,
+            params: {
+                checkout: this.state.checkout
+            }
+        });
+    },
+
+    // Request payment credential (delegation)
+    async requestPaymentCredential() {
+        if (!this.config.delegations.includes('payment.credential')) {
+            return null;
+        }
+
+        const request = {
+            jsonrpc: '2.0',
+            id: this.generateId(),
+            method: 'ec.payment.credential_request',
+            params: {
+                checkout: this.state.checkout
+            }
+        };
+
+        return new Promise((resolve, reject) => {
+            this.state.pendingRequests[request.id] = { resolve, reject };
+            this.sendToHost(request);
+
+            // Timeout after 5 minutes
+            setTimeout(() => {
+                if (this.state.pendingRequests[request.id]) {
+                    delete this.state.pendingRequests[request.id];
+                    reject({ code: -32001, message: 'Request timeout' });
+                }
+            }, 300000);
+        });
+    },
+
+    // Request address change (delegation)
+    async requestAddressChange() {
+        if (!this.config.delegations.includes('fulfillment.address_change')) {
+            return null;
+        }
+
+        const request = {
+            jsonrpc: '2.0',
+            id: this.generateId(),
+            method: 'ec.fulfillment.address_change_request',
+            params: {
+                checkout: this.state.checkout
+            }
+        };
+
+        return new Promise((resolve, reject) => {
+            this.state.pendingRequests[request.id] = { resolve, reject };
+            this.sendToHost(request);
+
+            setTimeout(() => {
+                if (this.state.pendingRequests[request.id]) {
+                    delete this.state.pendingRequests[request.id];
+                    reject({ code: -32001, message: 'Request timeout' });
+                }
+            }, 300000);
+        });
+    },
+
+    // Generate unique ID
+    generateId() {
+        return 'req_' + Math.random().toString(36).substr(2, 9);
+    },
+
+    // Logging
+    log(...args) {
+        console.log('[EC]', ...args);
+    },
+
+    // Debug rows are buffered and flushed once per animation frame so a
+    // chatty JSON-RPC exchange costs one layout/paint per frame instead
+    // of one per message
+    _debugBuf: [],
+    _debugScheduled: false,
+
+    debugLog(direction, message) {
+        if (!this.config.debug) return;
+
+        this._debugBuf.push({ direction, message });
+        if (!this._debugScheduled) {
+            this._debugScheduled = true;
+            requestAnimationFrame(() => this._flushDebug());
+        }
+    },
+
+    _flushDebug() {
+        this._debugScheduled = false;
+
+        const panel = document.getElementById('debug-panel');
+        panel.classList.add('active');
+
+        const fragment = document.createDocumentFragment();
+        for (const { direction, message } of this._debugBuf) {
+            const div = document.createElement('div');
+            div.className = `debug-message debug-${direction}`;
+            div.textContent = `[${direction.toUpperCase()}] ${JSON.stringify(message)}`;
+            fragment.insertBefore(div, fragment.firstChild);
+        }
+        this._debugBuf.length = 0;
+        panel.insertBefore(fragment, panel.firstChild);
+
+        // Keep only last 50 messages
+        while (panel.children.length > 50) {
+            panel.removeChild(panel.lastChild);
+        }
+    },
+
+    // Format currency
+    formatCurrency(amount) {
+        return new Intl.NumberFormat('en-US', {
+            style: 'currency',
+            currency: this.state.checkout.currency || 'USD'
+        }).format(amount / 100);
+    },
+
+    // Render the checkout UI
+    render() {
+        const app = document.getElementById('checkout-app');
+        const checkout = this.state.checkout;
+
+        if (checkout.status === 'completed') {
+            this.renderCompleted(app, checkout);
+            return;
+        }
+
+        app.innerHTML = `
+            <div class="checkout-header">
+                <h1>Checkout</h1>
+                <span class="checkout-status status-${checkout.status}">
+                    ${checkout.status?.replace(/_/g, ' ') || 'incomplete'}
+                </span>
+            </div>
+
+            ${this.renderMessages(checkout)}
+            ${this.renderLineItems(checkout)}
+            ${this.renderBuyerForm(checkout)}
+            ${this.renderTotals(checkout)}
+            ${this.renderActions(checkout)}
+        `;
+
+        this.attachEventListeners();
+    },
+
+    renderMessages(checkout) {
+        if (!checkout.messages?.length) return '';
+
+        return `
+            <div class="messages">
+                ${checkout.messages.map(msg => `
+                    <div class="message message-${msg.type || 'error'}">
+                        ${msg.content || msg.message}
+                    </div>
+                `).join('')}
+            </div>
+        `;
+    },
+
+    renderLineItems(checkout) {
+        if (!checkout.line_items?.length) return '';
+
+        return `
+            <div class="card">
+                <div class="card-title">Order Summary</div>
+                ${checkout.line_items.map(item => `
+                    <div class="line-item">
+                        <div class="item-info">
+                            ${item.item.image_url ? 
+                                `<img src="${item.item.image_url}" alt="${item.item.title}" class="item-image">` : 
+                                '<div class="item-image"></div>'
+                            }
+                            <div class="item-details">
+                                <h3>${item.item.title}</h3>
+                                <span class="quantity">Qty: ${item.quantity}</span>
+                            </div>
+                        </div>
+                        <span class="item-price">
+                            ${this.formatCurrency(item.item.price * item.quantity)}
+                        </span>
+                    </div>
+                `).join('')}
+            </div>
+        `;
+    },
+
+    renderBuyerForm(checkout) {
+        const buyer = checkout.buyer || {};
+
+        return `
+            <div class="card">
+                <div class="card-title">Contact Information</div>
+                <div class="form-group">
+                    <label for="email">Email</label>
+                    <input type="email" id="email" name="email" 
+                           value="${buyer.email || ''}" 
+                           placeholder="your@email.com">
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label for="firstName">First Name</label>
+                        <input type="text" id="firstName" name="firstName" 
+                               value="${buyer.first_name || ''}" 
+                               placeholder="John">
+                    </div>
+                    <div class="form-group">
+                        <label for="lastName">Last Name</label>
+                        <input type="text" id="lastName" name="lastName" 
+                               value="${buyer.last_name || ''}" 
+                               placeholder="Doe">
+                    </div>
+                </div>
+            </div>
+        `;
+    },
+
+    renderTotals(checkout) {
+        if (!checkout.totals?.length) return '';
+
+        return `
+            <div class="card">
+                <div class="card-title">Order Total</div>
+                <div class="totals">
+                    ${checkout.totals.map(total => `
+                        <div class="total-row ${total.type === 'total' ? 'final' : ''}">
+                            <span>${total.display_text}</span>
+                            <span>${this.formatCurrency(total.amount)}</span>
+                        </div>
+                    `).join('')}
+                </div>
+            </div>
+        `;
+    },
+
+    renderActions(checkout) {
+        const canComplete = checkout.status === 'ready_for_complete';
+
+        return `
+            <button id="completeBtn" class="btn btn-primary" ${canComplete ? '' : 'disabled'}>
+                ${canComplete ? 'Complete Order' : 'Fill Required Information'}
+            </button>
+            <button id="updateBtn" class="btn btn-secondary">
+                Update Information
+            </button>
+        `;
+    },
+
+    renderCompleted(app, checkout) {
+        app.innerHTML = `
+            <div class="card success-container">
+                <div class="success-icon">
+                    <svg fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path>
+                    </svg>
+                </div>
+                <h2>Order Confirmed!</h2>
+                <p>Thank you for your purchase</p>
+                ${checkout.order?.id ? `
+                    <div class="order-id">Order ID: ${checkout.order.id}</div>
+                ` : ''}
+                ${checkout.order?.permalink_url ? `
+                    <a href="${checkout.order.permalink_url}" class="btn btn-primary" style="margin-top: 20px; display: inline-block; width: auto;">
+                        View Order Details
+                    </a>
+                ` : ''}
+            </div>
+        `;
+
+        this.sendComplete();
+    },
+
+    attachEventListeners() {
+        // Update button
+        document.getElementById('updateBtn')?.addEventListener('click', () => {
+            this.updateBuyerInfo();
+        });
+
+        // Complete button
+        document.getElementById('completeBtn')?.addEventListener('click', () => {
+            this.completeCheckout();
+        });
+    },
+
+    async updateBuyerInfo() {
+        const email = document.getElementById('email')?.value;
+        const firstName = document.getElementById('firstName')?.value;
+        const lastName = document.getElementById('lastName')?.value;
+
+        try {
+            const response = await fetch(`/embedded-checkout/${this.config.checkoutId}/update`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    buyer: {
+                        email,
+                        first_name: firstName,
+                        last_name: lastName
+                    }
+                })
+            });
+
+            if (response.ok) {
+                const data = await response.json();
+                this.state.checkout = data.checkout;
+                this.render();
+                this.sendStateChange('buyer');
+            }
+        } catch (e) {
+            this.log('Error updating buyer info:', e);
+        }
+    },
+
+    async completeCheckout() {
+        try {
+            // Request payment credential if delegated
+            if (this.config.delegations.includes('payment.credential')) {
+                try {
+                    const credential = await this.requestPaymentCredential();
+                    if (credential?.credential) {
+                        // Handle payment credential
+                        this.log('Received payment credential');
+                    }
+                } catch (e) {
+                    if (e.code === -32001) {
+                        this.log('User cancelled payment');
+                        return;
+                    }
+                }
+            }
+
+            const response = await fetch(`/embedded-checkout/${this.config.checkoutId}/complete`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    idempotency_key: this.generateId()
+                })
+            });
+
+            if (response.ok) {
+                const data = await response.json();
+                this.state.checkout = data.checkout;
+                this.render();
+            }
+        } catch (e) {
+            this.log('Error completing checkout:', e);
+        }
+    }
+};
+
+// Initialize on DOM ready
+document.addEventListener('DOMContentLoaded', () => {
+    EmbeddedCheckout.init();
+});
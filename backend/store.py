@@ -208,6 +208,60 @@ class RetailStore:
 
     return checkout
 
+  def add_items_to_checkout(
+      self,
+      metadata: UcpMetadata,
+      items: list[tuple[str, int]],
+      checkout_id: str | None = None,
+  ) -> Checkout:
+    """Adds several products to the checkout in one pass.
+
+    Builds or loads the checkout once, merges every item, and
+    recalculates totals a single time instead of once per product.
+
+    Args:
+        metadata (UcpMetadata): UCP metadata object
+        items (list[tuple[str, int]]): (product_id, quantity) pairs
+        checkout_id (str | None, optional): checkout identifier
+
+    Returns:
+        Checkout: checkout object
+    """
+    if not checkout_id:
+      checkout_id = str(uuid4())
+      checkout_type = get_checkout_type(metadata)
+      checkout = checkout_type(
+          id=checkout_id,
+          ucp=metadata,
+          line_items=[],
+          currency=default_currency,
+          totals=[],
+          status="incomplete",
+          links=[],
+          payment=PaymentResponse(handlers=self._ucp_metadata["payment"]["handlers"]),
+      )
+    else:
+      checkout = self._checkouts.get(checkout_id)
+      if not checkout:
+        raise ValueError(f"Checkout with ID {checkout_id} not found")
+
+    line_items_by_id = {li.item.id: li for li in checkout.line_items}
+    for product_id, quantity in items:
+      line_item = line_items_by_id.get(product_id)
+      if line_item:
+        line_item.quantity += quantity
+        continue
+      product = self.get_product(product_id)
+      if not product:
+        raise ValueError(f"Product with ID {product_id} is not found")
+      line_item = self._get_line_item(product, quantity)
+      line_items_by_id[product_id] = line_item
+      checkout.line_items.append(line_item)
+
+    self._recalculate_checkout(checkout)
+    self._checkouts[checkout_id] = checkout
+    return checkout
+
   def get_checkout(self, checkout_id: str) -> Checkout | None:
     """Retrieves a Checkout by its ID.
 
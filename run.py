@@ -12,80 +12,170 @@ This script:
 2. Opens agent chat interface
 """
 
+import collections
+import select
 import subprocess
+import socket
 import sys
 import os
 import time
 import threading
-import atexit
 
 # Server process reference
 server_process = None
 
+SERVER_PORT = 10999
+
+# Child environment built once: both launch paths need the same
+# PYTHONPATH augmentation, so there is no reason to copy os.environ
+# and rebuild the string per spawn. os.pathsep keeps the entries
+# separate on POSIX too — a literal ";" is Windows-only and collapses
+# everything into one malformed path entry elsewhere. PYTHONNOUSERSITE
+# skips the per-user site-packages scan at child startup; everything
+# the children need comes from PYTHONPATH or the main site-packages.
+_CHILD_ENV = {
+    **os.environ,
+    "PYTHONPATH": os.pathsep.join(
+        entry
+        for entry in (".", os.path.join("sdk", "python", "src"),
+                      os.environ.get("PYTHONPATH", ""))
+        if entry
+    ),
+    "PYTHONNOUSERSITE": "1",
+}
+
+
+# Last stderr lines from the server, kept for failure diagnostics
+_server_stderr = collections.deque(maxlen=200)
+
+
+def _drain_stderr(pipe):
+    """Drain the server's stderr into a bounded deque.
+
+    The server logs to stderr; with nobody reading the pipe, the kernel
+    buffer (~64 KiB) eventually fills and the server blocks on write.
+    """
+    with pipe:
+        for line in iter(pipe.readline, b""):
+            _server_stderr.append(line)
+
+
+def _wait_for_server(timeout=10.0):
+    """Wait until the server accepts TCP connections or its process dies.
+
+    Probing the port with a short exponential backoff returns as soon as
+    the server is actually listening, instead of always paying a fixed
+    two-second sleep that is both too long on fast starts and too short
+    on slow ones.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        if server_process.poll() is not None:
+            if _server_stderr:
+                print(b"".join(_server_stderr).decode(errors="replace").strip())
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            if sock.connect_ex(("127.0.0.1", SERVER_PORT)) == 0:
+                return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+    return False
+
 def start_server():
     """Start MCP server in background."""
     global server_process
     
     print("[*] Starting MCP Server...")
-    
-    # Prepare environment with SDK path
-    env = os.environ.copy()
-    env['PYTHONPATH'] = f".;sdk/python/src;{env.get('PYTHONPATH', '')}"
-    
+
+    # Windows-only kwargs live in their own branch so the POSIX call
+    # stays minimal and eligible for CPython's posix_spawn fast path
+    # (the stderr pipe is fine — it maps to a spawn file action)
+    popen_kwargs = {}
+    if sys.platform == 'win32':
+        popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
     server_process = subprocess.Popen(
         [sys.executable, "-m", "backend.mcp_server.streamable_http_server"],
-        env=env,
-        stdout=subprocess.PIPE,
+        env=_CHILD_ENV,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        **popen_kwargs
     )
-    
+    threading.Thread(
+        target=_drain_stderr, args=(server_process.stderr,), daemon=True
+    ).start()
+
     # Wait for server to start
-    time.sleep(2)
-    
-    if server_process.poll() is None:
-        print("[OK] MCP Server started on http://localhost:10999")
+    if _wait_for_server():
+        print(f"[OK] MCP Server started on http://localhost:{SERVER_PORT}")
         return True
     else:
         print("[ERROR] Failed to start MCP Server")
         return False
 
+def _wait_child(process, timeout):
+    """Wait for a child to exit, sleeping in the kernel where possible.
+
+    Popen.wait(timeout=...) on POSIX is a polling loop around
+    waitpid(WNOHANG) with sleeps up to 50 ms; a pidfd lets select()
+    block until the exact moment the child exits. Windows Popen.wait
+    already blocks natively, and kernels without pidfd_open (< 5.3)
+    fall back to the polling wait.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            pass
+        else:
+            try:
+                select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return process.wait(timeout=0)
+    return process.wait(timeout=timeout)
+
+
 def stop_server():
-    """Stop the MCP server."""
+    """Stop the MCP server. Safe to call more than once."""
     global server_process
-    if server_process:
-        print("\n[*] Stopping MCP Server...")
-        server_process.terminate()
-        server_process.wait(timeout=5)
-        print("[OK] Server stopped")
+    process, server_process = server_process, None
+    if process is None:
+        return
+    print("\n[*] Stopping MCP Server...")
+    process.terminate()
+    _wait_child(process, 5)
+    print("[OK] Server stopped")
 
 def run_agent():
     """Run agent chat."""
-    print("[*] Starting Agent Chat...\n")
-    print("=" * 50)
-    print("  UCP Shopping Agent")
-    print("  Type your message and press Enter")
-    print("  Type 'quit' to exit")
-    print("=" * 50 + "\n")
-    
-    # Prepare environment
-    env = os.environ.copy()
-    env['PYTHONPATH'] = f".;sdk/python/src;{env.get('PYTHONPATH', '')}"
-    
+    # One buffered write instead of six print calls, each of which
+    # formats and flushes separately on a line-buffered TTY
+    sys.stdout.write(
+        "[*] Starting Agent Chat...\n\n"
+        + "=" * 50
+        + "\n  UCP Shopping Agent"
+        "\n  Type your message and press Enter"
+        "\n  Type 'quit' to exit\n"
+        + "=" * 50
+        + "\n\n"
+    )
+    sys.stdout.flush()
+
     # Run agent chat
     subprocess.run(
         [sys.executable, "-m", "app", "chat", "--simple"],
-        env=env
+        env=_CHILD_ENV
     )
 
 def main():
-    print("\n" + "=" * 50)
-    print("  UCP-AGENT System Launcher")
-    print("=" * 50 + "\n")
-    
-    # Register cleanup
-    atexit.register(stop_server)
-    
+    sys.stdout.write(
+        "\n" + "=" * 50 + "\n  UCP-AGENT System Launcher\n" + "=" * 50 + "\n\n"
+    )
+    sys.stdout.flush()
+
     # Start server
     if not start_server():
         print("[ERROR] Cannot start server. Check if port 10999 is available.")
@@ -0,0 +1,55 @@
+# Copyright 2026 UCP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Minify the embedded checkout static assets.
+
+Writes .min.css / .min.js siblings next to the sources in backend/static;
+the embedded checkout routes prefer the minified files when present.
+Requires the dev extras (csscompressor, rjsmin):
+
+    python scripts/build_static.py
+"""
+
+import os
+import sys
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "..", "backend", "static")
+
+
+def build() -> int:
+    try:
+        from csscompressor import compress as compress_css
+        from rjsmin import jsmin
+    except ImportError:
+        print("csscompressor and rjsmin are required (pip install -e .[dev])")
+        return 1
+
+    for name in os.listdir(STATIC_DIR):
+        base, dot, ext = name.rpartition(".")
+        if ext not in ("css", "js") or base.endswith(".min"):
+            continue
+        source_path = os.path.join(STATIC_DIR, name)
+        with open(source_path, "r", encoding="utf-8") as f:
+            source = f.read()
+        minified = compress_css(source) if ext == "css" else jsmin(source)
+        out_path = os.path.join(STATIC_DIR, f"{base}.min.{ext}")
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(minified)
+        print(f"{name}: {len(source)} -> {len(minified)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(build())